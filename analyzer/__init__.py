@@ -0,0 +1,6 @@
+from .lexer import (IncrementalLexer, Token, TokenBuffer, TokenCursor, TokenType, iter_tokens,
+                    tokenize, tokenize_mmap)
+from .parser import (Diagnostic, IncrementalParser, ParseError, PrintTracer, Tracer, TraceLevel,
+                     check_program, parse_program, recover_program, set_tracer)
+from .symbols import InternTable, Symbol, SymbolTable
+from .tree import Node, NodeKind, SyntaxTree
@@ -0,0 +1,111 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from .cache import TokenCache, cached_tokenize
+from .parser import ParseError, check_program
+
+
+# The files named by paths, in order and without repeats. A directory is
+# walked for files matching pattern; anything else is expanded as a glob,
+# where ** matches any number of directories.
+def find_files(paths, pattern="*.py"):
+    files = {}
+    for path in paths:
+        if os.path.isdir(path):
+            matches = sorted(glob.glob(os.path.join(path, "**", pattern), recursive=True))
+        else:
+            matches = sorted(glob.glob(path, recursive=True))
+        for match in matches:
+            if os.path.isfile(match):
+                files.setdefault(match, None)
+    return list(files)
+
+
+# Lex and parse one file in a worker. The lexer's messages about invalid
+# characters are dropped; the result is (path, token count, first error or
+# None), with the line and column of a syntax error. Tokens go through the token cache in cache_dir when there is one.
+def analyze_file(path, lexer_engine="loop", parser_engine="recursive", cache_dir=None):
+    try:
+        with open(path) as f:
+            code_input = f.read()
+        with contextlib.redirect_stdout(io.StringIO()):
+            cache = None if cache_dir is None else TokenCache(cache_dir)
+            tokens = cached_tokenize(code_input, cache, lexer_engine)
+            error = check_program(tokens, 0, parser_engine)
+    except Exception as e:
+        return path, 0, f"{type(e).__name__}: {e}"
+    if isinstance(error, ParseError):
+        line_number, column = tokens.position(error.index)
+        return path, len(tokens), f"line {line_number}, column {column}: {str(error).strip()}"
+    if isinstance(error, IndexError):
+        return path, len(tokens), "Make sure the program ends with 'end'"
+    if error is not None:
+        return path, len(tokens), str(error).strip() or type(error).__name__
+    return path, len(tokens), None
+
+
+# Analyze every file found under paths on a pool of worker processes. Files
+# go to the workers in chunks so that each round trip carries many small
+# files. Returns the aggregated report as a dict that json.dump can write.
+def run_batch(paths, pattern="*.py", workers=None, chunk_size=None,
+              lexer_engine="loop", parser_engine="recursive", cache_dir=None):
+    files = find_files(paths, pattern)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, len(files) // (workers * 4))
+    results = []
+    if files:
+        with ProcessPoolExecutor(min(workers, len(files))) as pool:
+            results = list(pool.map(analyze_file, files, repeat(lexer_engine), repeat(parser_engine),
+                                    repeat(cache_dir), chunksize=chunk_size))
+    failed = sum(1 for _, _, error in results if error is not None)
+    return {
+        "files": len(results),
+        "passed": len(results) - failed,
+        "failed": failed,
+        "tokens": sum(token_count for _, token_count, _ in results),
+        "results": [{"path": path, "tokens": token_count, "error": error}
+                    for path, token_count, error in results],
+    }
+
+
+def print_report(report):
+    for result in report["results"]:
+        if result["error"] is not None:
+            print(f"FAIL {result['path']}: {result['error']}")
+    print(f"{report['files']} files, {report['passed']} passed, {report['failed']} failed, "
+          f"{report['tokens']} tokens")
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(
+        prog="analyzer.batch", description="Lex and parse many files on a pool of processes")
+    arguments.add_argument("paths", nargs="+", help="directories or glob patterns")
+    arguments.add_argument("--pattern", default="*.py", help="file pattern inside directories")
+    arguments.add_argument("-j", "--workers", type=int, default=None)
+    arguments.add_argument("--chunk-size", type=int, default=None)
+    arguments.add_argument("--lexer", choices=["loop", "regex"], default="loop")
+    arguments.add_argument("--parser", choices=["recursive", "ll1"], default="recursive")
+    arguments.add_argument("--cache-dir", help="directory of the on-disk token cache")
+    arguments.add_argument("--json", action="store_true", help="print the report as JSON")
+    options = arguments.parse_args(argv)
+    report = run_batch(options.paths, options.pattern, options.workers, options.chunk_size,
+                       options.lexer, options.parser, options.cache_dir)
+    if options.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
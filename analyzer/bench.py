@@ -0,0 +1,106 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from .generate import generate_program
+from .lexer import tokenize
+from .parser import check_program
+
+default_sizes = ["1K", "10K", "100K", "1M", "10M", "100M"]
+size_units = {"": 1, "K": 1024, "M": 1024 * 1024}
+
+
+# "1K" -> 1024, "100M" -> 104857600
+def parse_size(size):
+    size = size.strip().upper().rstrip("B")
+    unit = size[-1:] if size[-1:] in size_units else ""
+    return int(size[:len(size) - len(unit)]) * size_units[unit]
+
+
+def best_time(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+# Time tokenize() and the parser on a generated program of size bytes, then
+# run both once more under tracemalloc for the peak memory they allocate.
+# The lexer's and parser's own output is thrown away.
+def benchmark_size(size, seed=0, lexer_engine="loop", parser_engine="recursive", repeat=3):
+    code_input, statements = generate_program(size, seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        tokenize_seconds, tokens = best_time(lambda: tokenize(code_input, lexer_engine), repeat)
+        parse_seconds, error = best_time(lambda: check_program(tokens, 0, parser_engine), repeat)
+        token_count = len(tokens)
+        del tokens
+        tracemalloc.start()
+        try:
+            check_program(tokenize(code_input, lexer_engine), 0, parser_engine)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        "size_bytes": len(code_input),
+        "tokens": token_count,
+        "statements": statements,
+        "parsed": error is None,
+        "tokenize_seconds": tokenize_seconds,
+        "tokens_per_second": token_count / tokenize_seconds,
+        "parse_seconds": parse_seconds,
+        "statements_per_second": statements / parse_seconds,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_benchmarks(sizes=default_sizes, seed=0, lexer_engine="loop", parser_engine="recursive", repeat=3):
+    results = []
+    for size in sizes:
+        result = benchmark_size(parse_size(size), seed, lexer_engine, parser_engine, repeat)
+        print(f"{size:>6} {result['tokens_per_second']:14.0f} tokens/s {result['statements_per_second']:14.0f} "
+              f"statements/s {result['peak_memory_bytes'] / 1024 / 1024:10.1f} MB peak", file=sys.stderr)
+        results.append(result)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "seed": seed,
+        "lexer": lexer_engine,
+        "parser": parser_engine,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(
+        prog="analyzer.bench", description="Benchmark the lexer and parser on generated programs")
+    arguments.add_argument("--sizes", default=",".join(default_sizes),
+                           help="comma separated program sizes, such as 1K,10M")
+    arguments.add_argument("--seed", type=int, default=0)
+    arguments.add_argument("--lexer", choices=["loop", "regex"], default="loop")
+    arguments.add_argument("--parser", choices=["recursive", "ll1"], default="recursive")
+    arguments.add_argument("--repeat", type=int, default=3)
+    arguments.add_argument("--output", help="write the JSON results here instead of to stdout")
+    options = arguments.parse_args(argv)
+    report = run_benchmarks(options.sizes.split(","), options.seed, options.lexer, options.parser,
+                            options.repeat)
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
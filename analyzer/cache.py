@@ -0,0 +1,173 @@
+import contextlib
+import hashlib
+import io
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from .lexer import TokenBuffer, token_patterns, tokenize
+from .symbols import InternTable
+
+# Entry layout: the header, then the starts, ends, lines and symbol_ids
+# columns as native uint32, the kinds as one byte each, the interned names
+# joined by newlines and the messages the lexer printed. Columns are loaded
+# as memoryviews on a mapping of the file, so a hit copies nothing but the
+# names and messages.
+CACHE_FORMAT = 2
+CACHE_MAGIC = b"TOKC"
+HEADER = struct.Struct("<4sBBxxIII")
+BYTE_ORDERS = {"little": 0, "big": 1}
+# An eviction deletes entries until the cache is down to this share of
+# max_bytes, so the puts after it do not each have to evict again
+EVICT_TO = 0.75
+
+lexer_spec_versions = []
+
+
+# A hash of token_patterns. It is part of every cache key, so entries made by
+# a lexer with other patterns are never read back.
+def lexer_spec_version():
+    if not lexer_spec_versions:
+        spec = repr((CACHE_FORMAT, token_patterns)).encode("utf-8")
+        lexer_spec_versions.append(hashlib.sha256(spec).hexdigest())
+    return lexer_spec_versions[0]
+
+
+# Token buffers on disk, keyed by the contents of the source they were lexed
+# from. The directory is kept under max_bytes by deleting the least recently
+# used entries; reading an entry counts as a use. The size of the cache is
+# counted once when it is opened and then kept up to date by put, so the
+# directory is only listed again when an entry has to be evicted. Other
+# processes writing to the same directory are caught up with then.
+class TokenCache:
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.total = sum(size for _, size, _ in self.entries())
+
+    def key(self, code_input):
+        digest = hashlib.sha256(lexer_spec_version().encode("ascii"))
+        digest.update(code_input.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + ".tokens")
+
+    # The cached TokenBuffer for code_input and the lexer's messages, or None
+    # on a miss
+    def get(self, code_input):
+        path = self.path(self.key(code_input))
+        try:
+            with open(path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(data) < HEADER.size:
+            return None
+        magic, version, byte_order, count, names_size, messages_size = HEADER.unpack_from(data)
+        if (magic != CACHE_MAGIC or version != CACHE_FORMAT or byte_order != BYTE_ORDERS[sys.byteorder]
+                or len(data) != HEADER.size + count * 17 + names_size + messages_size):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        view = memoryview(data)
+        tokens = TokenBuffer(code_input, symbols=InternTable())
+        offset = HEADER.size
+        for column in ("starts", "ends", "lines", "symbol_ids"):
+            setattr(tokens, column, view[offset:offset + count * 4].cast("I"))
+            offset += count * 4
+        tokens.kinds = view[offset:offset + count]
+        offset += count
+        if names_size:
+            for name in bytes(view[offset:offset + names_size]).decode("utf-8").split("\n"):
+                tokens.symbols.intern(name)
+        offset += names_size
+        messages = bytes(view[offset:offset + messages_size]).decode("utf-8")
+        return tokens, messages
+
+    # Store tokens and messages, what the lexer printed while lexing code_input
+    def put(self, code_input, tokens, messages=""):
+        count = len(tokens)
+        names = "\n".join(tokens.symbols.names[1:]).encode("utf-8")
+        encoded_messages = messages.encode("utf-8")
+        header = HEADER.pack(CACHE_MAGIC, CACHE_FORMAT, BYTE_ORDERS[sys.byteorder], count, len(names),
+                             len(encoded_messages))
+        size = HEADER.size + count * 17 + len(names) + len(encoded_messages)
+        path = self.path(self.key(code_input))
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                for column in (tokens.starts, tokens.ends, tokens.lines, tokens.symbol_ids):
+                    f.write(array("I", column).tobytes())
+                f.write(array("B", tokens.kinds).tobytes())
+                f.write(names)
+                f.write(encoded_messages)
+            try:
+                # An entry for the same source is replaced, not added to
+                self.total -= os.stat(path).st_size
+            except OSError:
+                pass
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        self.total += size
+        if self.total > self.max_bytes:
+            self.evict()
+
+    # (modification time, size, path) of every entry in the directory
+    def entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".tokens"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    # Delete the least recently used entries until the cache is down to
+    # EVICT_TO of max_bytes
+    def evict(self):
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes * EVICT_TO:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self.total = total
+
+
+# tokenize() through the cache: a hit skips lexing entirely, a miss lexes and
+# stores the result. The lexer's messages about invalid characters and string
+# literals are stored with the tokens and printed again on a hit, so the
+# output is the same either way. With cache None this is just tokenize().
+def cached_tokenize(code_input, cache=None, engine="loop"):
+    if cache is None:
+        return tokenize(code_input, engine)
+    entry = cache.get(code_input)
+    if entry is None:
+        messages = io.StringIO()
+        with contextlib.redirect_stdout(messages):
+            tokens = tokenize(code_input, engine)
+        cache.put(code_input, tokens, messages.getvalue())
+        entry = tokens, messages.getvalue()
+    tokens, messages = entry
+    print(messages, end="")
+    return tokens
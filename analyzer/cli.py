@@ -0,0 +1,153 @@
+import argparse
+
+from .lexer import LinkedList, TokenBuffer, lexer_engines, tokenize, tokenize_mmap
+from .parser import PrintTracer, TraceLevel, benchmark_parsers, parse_program, print_diagnostics, set_tracer
+from .symbols import SymbolTable
+from .tree import SyntaxTree
+
+
+# Our tokens against nltk's wordpunct tokens, in one merge of the two
+# streams of offsets into code_input. nltk tokenizes the whole input once and
+# neither side builds a token list. Yields (line number, our lexeme, nltk's
+# lexeme) for every token they disagree on, with None for the side that has
+# no token there. nltk is slow to import, so it is only imported here.
+def nltk_differences(code_input, engine="loop"):
+    from nltk.tokenize import WordPunctTokenizer
+
+    ours = lexer_engines[engine](code_input)
+    theirs = WordPunctTokenizer().span_tokenize(code_input)
+    our_token = next(ours, None)
+    their_token = next(theirs, None)
+    line_number = 1
+    counted = 0
+    while our_token is not None or their_token is not None:
+        if their_token is not None:
+            line_number += code_input.count("\n", counted, their_token[0])
+            counted = their_token[0]
+        if their_token is None or (our_token is not None and our_token[0] < their_token[0]):
+            start, end, _, our_line = our_token
+            yield our_line, code_input[start:end], None
+            our_token = next(ours, None)
+        elif our_token is None or their_token[0] < our_token[0]:
+            yield line_number, None, code_input[their_token[0]:their_token[1]]
+            their_token = next(theirs, None)
+        else:
+            start, end, _, our_line = our_token
+            if end != their_token[1]:
+                yield our_line, code_input[start:end], code_input[their_token[0]:their_token[1]]
+            our_token = next(ours, None)
+            their_token = next(theirs, None)
+
+
+def print_nltk_comparison(code_input, engine="loop"):
+    differences = 0
+    for line_number, ours, theirs in nltk_differences(code_input, engine):
+        differences += 1
+        print(f"line {line_number}: ours {ours!r}, nltk {theirs!r}")
+    print(f"{differences} tokens differ from nltk's wordpunct tokens\n")
+
+
+def print_tokens(tokens):
+    LinkedList(tokens).print_list()
+    print("\n")
+    print("\tThe output is in the order of The Tokens (Token Number, Token Class, Token Type, Line Number)\t")
+    print("\n")
+    for token in tokens:
+        print("\t", str(token), end='  ')
+        print('\n')
+
+
+# Lex and parse one file and print the results. input_mode "read" loads the
+# whole file into a string, "mmap" lexes straight from a memory map of it.
+# lexer_engine is "loop" or "regex", parser_engine "recursive", "ll1" or
+# "benchmark" and parser_trace one of the TraceLevel names. With a cache_dir,
+# tokens of a file lexed before are read back from the token cache there.
+# With counters, the per-pattern and per-rule counters are printed at the end.
+# With recover, the parser reports every syntax error instead of the first.
+# With symbols, the symbols the program declares are printed after the parse,
+# and with tree, its syntax tree. lex_workers above 1 lexes a file that is
+# read in on that many processes, and parse_workers above 1 parses its
+# top-level statements on that many, reporting every error as with recover.
+def run(input_path, input_mode="read", lexer_engine="loop", parser_engine="recursive",
+        parser_trace="off", nltk_tokens=False, cache_dir=None, counters=False, recover=False,
+        symbols=False, tree=False, lex_workers=1, parse_workers=1):
+    set_tracer(PrintTracer(TraceLevel[parser_trace.upper()]))
+    hot_paths = None
+    if counters:
+        from .counters import HotPathCounters
+        hot_paths = HotPathCounters()
+        hot_paths.enable()
+    print("\n")
+    print("\n")
+    if input_mode == "mmap":
+        tokens = tokenize_mmap(input_path)
+    else:
+        with open(input_path) as f:
+            code_input = f.read()
+        if nltk_tokens:
+            print_nltk_comparison(code_input, lexer_engine)
+        if lex_workers > 1:
+            from .parallel import tokenize_parallel
+            tokens = tokenize_parallel(code_input, lexer_engine, lex_workers)
+        elif cache_dir is None:
+            tokens = tokenize(code_input, lexer_engine)
+        else:
+            from .cache import TokenCache, cached_tokenize
+            tokens = cached_tokenize(code_input, TokenCache(cache_dir), lexer_engine)
+    print_tokens(tokens)
+
+    # Parse and execute the program
+    if parser_engine == "benchmark":
+        benchmark_parsers(tokens)
+    elif (parse_workers > 1 and parser_engine == "recursive" and not symbols
+          and isinstance(tokens, TokenBuffer)):
+        from .parallel import parse_parallel
+        diagnostics, syntax_tree = parse_parallel(tokens, parse_workers, tree=tree)
+        print_diagnostics(diagnostics)
+        if syntax_tree is not None:
+            print("\t\t\tSYNTAX TREE\t\t\t\n")
+            syntax_tree.print_tree(tokens)
+    else:
+        symbol_table = SymbolTable() if symbols else None
+        syntax_tree = SyntaxTree() if tree else None
+        parse_program(tokens, 0, parser_engine, recover, symbol_table, syntax_tree)
+        if symbol_table is not None:
+            print("\t\t\tSYMBOL TABLE\t\t\t\n")
+            symbol_table.print_table()
+        if syntax_tree is not None:
+            print("\t\t\tSYNTAX TREE\t\t\t\n")
+            syntax_tree.print_tree(tokens)
+    if hot_paths is not None:
+        hot_paths.disable()
+        print(hot_paths.table())
+    return tokens
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(
+        prog="analyzer", description="Lexical and syntax analyzer for the CFGs language")
+    arguments.add_argument("input_path")
+    arguments.add_argument("--input-mode", choices=["read", "mmap"], default="read")
+    arguments.add_argument("--lexer", choices=["loop", "regex"], default="loop")
+    arguments.add_argument("--parser", choices=["recursive", "ll1", "benchmark"], default="recursive")
+    arguments.add_argument("--trace", choices=[level.name.lower() for level in TraceLevel], default="off")
+    arguments.add_argument("--cache-dir", help="directory of the on-disk token cache")
+    arguments.add_argument("--lex-workers", type=int, default=1,
+                           help="lex the file on this many processes (read input mode, no cache)")
+    arguments.add_argument("--parse-workers", type=int, default=1,
+                           help="parse top-level statements on this many processes, reporting every "
+                                "syntax error (recursive parser, no --symbols)")
+    arguments.add_argument("--recover", action="store_true",
+                           help="report every syntax error, not just the first (recursive parser)")
+    arguments.add_argument("--symbols", action="store_true",
+                           help="print the symbols the program declares (recursive parser)")
+    arguments.add_argument("--tree", action="store_true",
+                           help="print the syntax tree of the program (recursive parser)")
+    arguments.add_argument("--counters", action="store_true",
+                           help="count pattern attempts and rule calls and print them at the end")
+    arguments.add_argument("--nltk", action="store_true",
+                           help="also list every token that differs from nltk's wordpunct tokens")
+    options = arguments.parse_args(argv)
+    run(options.input_path, options.input_mode, options.lexer, options.parser, options.trace, options.nltk,
+        options.cache_dir, options.counters, options.recover, options.symbols, options.tree,
+        options.lex_workers, options.parse_workers)
@@ -0,0 +1,157 @@
+import contextlib
+import time
+
+from . import lexer, parser
+
+# The driver loops are left out, their time is the whole parse
+uncounted_rules = {"parse_program", "parse_statements"}
+
+
+# Counts for every token pattern (attempts, hits and time spent matching) and
+# every parser rule (calls, tokens consumed and inclusive time). Nothing is
+# counted until enable() swaps counting versions of the pattern matchers and
+# rule functions in, and disable() puts the originals back, so the counters
+# cost nothing while they are off.
+class HotPathCounters:
+    def __init__(self):
+        self.patterns = [[0, 0, 0.0] for _ in lexer.token_patterns]
+        self.rules = {}
+        self.saved = None
+
+    def enable(self):
+        if self.saved is not None:
+            return
+        matchers = list(lexer.get_line_matchers())
+        scanner_patterns = dict(lexer.scanner_patterns)
+        rules = {name: function for name, function in vars(parser).items()
+                 if callable(function) and (name.startswith("parse_") or name.startswith("class_body"))
+                 and name not in uncounted_rules}
+        statement_parsers = dict(parser.statement_parsers)
+        self.saved = (matchers, scanner_patterns, rules, statement_parsers)
+
+        lexer.line_matchers[:] = [(self.count_pattern(position, match_pattern), kind)
+                                  for position, (match_pattern, kind) in enumerate(matchers)]
+        for binary in (False, True):
+            lexer.scanner_patterns[binary] = CountedScannerPatterns(
+                lexer.get_scanner_patterns(binary), self.patterns)
+        counted = {}
+        for name, function in rules.items():
+            counted[function] = self.count_rule(name, function)
+            setattr(parser, name, counted[function])
+        for kind, function in statement_parsers.items():
+            parser.statement_parsers[kind] = counted.get(function, function)
+
+    def disable(self):
+        if self.saved is None:
+            return
+        matchers, scanner_patterns, rules, statement_parsers = self.saved
+        lexer.line_matchers[:] = matchers
+        lexer.scanner_patterns.clear()
+        lexer.scanner_patterns.update(scanner_patterns)
+        for name, function in rules.items():
+            setattr(parser, name, function)
+        parser.statement_parsers.update(statement_parsers)
+        self.saved = None
+
+    def count_pattern(self, position, match_pattern):
+        counts = self.patterns[position]
+        clock = time.perf_counter
+
+        def match(line):
+            start = clock()
+            result = match_pattern(line)
+            counts[2] += clock() - start
+            counts[0] += 1
+            if result:
+                counts[1] += 1
+            return result
+        return match
+
+    def count_rule(self, name, function):
+        counts = self.rules.setdefault(name, [0, 0, 0.0])
+        clock = time.perf_counter
+
+        def rule(tokens, index, *args):
+            start = clock()
+            try:
+                result = function(tokens, index, *args)
+            finally:
+                counts[0] += 1
+                counts[2] += clock() - start
+            end = result[1] if isinstance(result, tuple) else result
+            if isinstance(end, int):
+                counts[1] += end - index
+            return result
+        return rule
+
+    def as_dict(self):
+        return {
+            "patterns": {
+                f"{position}:{token_type}": {"pattern": pattern, "attempts": attempts, "hits": hits,
+                                             "seconds": seconds}
+                for position, ((pattern, token_type, _), (attempts, hits, seconds))
+                in enumerate(zip(lexer.token_patterns, self.patterns)) if attempts
+            },
+            "rules": {
+                name: {"calls": calls, "tokens": tokens, "seconds": seconds}
+                for name, (calls, tokens, seconds) in self.rules.items() if calls
+            },
+        }
+
+    # Both tables, slowest first
+    def table(self):
+        counters = self.as_dict()
+        lines = [f"{'pattern':<28} {'attempts':>10} {'hits':>10} {'ms':>10}"]
+        for name, counts in sorted(counters["patterns"].items(), key=lambda item: -item[1]["seconds"]):
+            lines.append(f"{name:<28} {counts['attempts']:>10} {counts['hits']:>10} "
+                         f"{counts['seconds'] * 1000:>10.3f}")
+        lines.append("")
+        lines.append(f"{'rule':<28} {'calls':>10} {'tokens':>10} {'ms':>10}")
+        for name, counts in sorted(counters["rules"].items(), key=lambda item: -item[1]["seconds"]):
+            lines.append(f"{name:<28} {counts['calls']:>10} {counts['tokens']:>10} "
+                         f"{counts['seconds'] * 1000:>10.3f}")
+        return "\n".join(lines)
+
+
+# The regex engine matches every pattern at once, so a match counts as one
+# attempt of each pattern up to the one that won, in alternation order, and
+# all of its time goes to the winner.
+class CountedScannerPatterns:
+    def __init__(self, patterns, counts):
+        self.patterns = patterns
+        self.binary = patterns.binary
+        self.whitespace = patterns.whitespace
+        self.newline = patterns.newline
+        self.quotes = patterns.quotes
+        self.decode = patterns.decode
+        self.master = CountedMaster(patterns.master, counts)
+
+
+class CountedMaster:
+    def __init__(self, master, counts):
+        self.master = master
+        self.counts = counts
+
+    def match(self, source, pos, endpos):
+        start = time.perf_counter()
+        result = self.master.match(source, pos, endpos)
+        seconds = time.perf_counter() - start
+        counts = self.counts
+        winner = int(result.lastgroup[1:]) if result else len(counts) - 1
+        for position in range(winner + 1):
+            counts[position][0] += 1
+        if result:
+            counts[winner][1] += 1
+            counts[winner][2] += seconds
+        return result
+
+
+# Count everything run inside the with block
+@contextlib.contextmanager
+def count_hot_paths():
+    counters = HotPathCounters()
+    counters.enable()
+    try:
+        yield counters
+    finally:
+        counters.disable()
@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .lexer import get_line_matchers, get_scanner_patterns, tokenize
+from .parser import Diagnostic, ParseError, check_program, get_ll1_parser, recover_program
+
+# One request or response per line; a line may hold a whole source file
+max_line_size = 64 * 1024 * 1024
+
+
+# Compile the pattern tables and load the LL(1) parse table in a worker
+# before it takes its first request
+def warm_up():
+    get_line_matchers()
+    get_scanner_patterns()
+    get_ll1_parser()
+    return os.getpid()
+
+
+# The Diagnostic for an error check_program returned. The LL(1) parser does
+# not say which token it stopped at, and running out of tokens has none.
+def error_diagnostic(tokens, error):
+    if isinstance(error, IndexError):
+        return Diagnostic("Make sure the program ends with 'end'", None, None)
+    if isinstance(error, ParseError):
+        return Diagnostic(str(error).strip(), error.index, *tokens.position(error.index))
+    return Diagnostic(str(error).strip(), None, None)
+
+
+# Lex and parse one request in a worker. The request has the program as
+# "source" text or as a file "path", and optionally "lexer", "parser" and
+# "recover" as on the command line. The response has the token count, whether
+# the program parsed and its syntax errors with their line and column, or
+# "error" when the request could not be carried out.
+def analyze_request(request):
+    try:
+        if "source" in request:
+            code_input = request["source"]
+        else:
+            with open(request["path"]) as f:
+                code_input = f.read()
+        lexer_engine = request.get("lexer", "loop")
+        parser_engine = request.get("parser", "recursive")
+        with contextlib.redirect_stdout(io.StringIO()):
+            tokens = tokenize(code_input, lexer_engine)
+            if request.get("recover"):
+                diagnostics = recover_program(tokens)
+            else:
+                error = check_program(tokens, 0, parser_engine)
+                diagnostics = [] if error is None else [error_diagnostic(tokens, error)]
+    except (KeyError, TypeError) as e:
+        return {"error": f"Bad request: {e}"}
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+    errors = [{"message": diagnostic.message, "token": diagnostic.index, "line": diagnostic.line_number,
+               "column": diagnostic.column} for diagnostic in diagnostics]
+    return {"tokens": len(tokens), "parsed": not errors, "errors": errors}
+
+
+# Serves analyze requests on one connection, in order. A request that is not
+# a JSON object is answered with an error; an "id" in the request is copied
+# into its response.
+async def handle_connection(reader, writer, pool):
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                response = {"error": "Request too long"}
+                line = None
+            else:
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                if not isinstance(request, dict):
+                    response = {"error": "Bad request: expected a JSON object"}
+                else:
+                    response = await loop.run_in_executor(pool, analyze_request, request)
+                    if "id" in request:
+                        response["id"] = request["id"]
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+            if line is None:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+# Listen on the Unix socket socket_path, or on host and port, until
+# cancelled or sent SIGTERM. Every worker is started and warmed up before the
+# first connection is accepted.
+async def serve(socket_path=None, host="127.0.0.1", port=8765, workers=None):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+    with contextlib.suppress(NotImplementedError):
+        loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    with ProcessPoolExecutor(workers, initializer=warm_up) as pool:
+        await asyncio.gather(*(loop.run_in_executor(pool, warm_up) for _ in range(workers)))
+
+        async def handle(reader, writer):
+            await handle_connection(reader, writer, pool)
+
+        if socket_path is not None:
+            server = await asyncio.start_unix_server(handle, socket_path, limit=max_line_size)
+            address = socket_path
+        else:
+            server = await asyncio.start_server(handle, host, port, limit=max_line_size)
+            address = f"{host}:{port}"
+        print(f"Listening on {address} with {workers} workers", file=sys.stderr)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if socket_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(socket_path)
+
+
+# A blocking client for the daemon, for scripts and tests. Each analyze()
+# sends one request and waits for its response.
+class DaemonClient:
+    def __init__(self, socket_path=None, host="127.0.0.1", port=8765):
+        if socket_path is not None:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(socket_path)
+        else:
+            self.socket = socket.create_connection((host, port))
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.responses = self.socket.makefile("rb")
+
+    def analyze(self, source=None, path=None, **options):
+        request = dict(options)
+        if source is not None:
+            request["source"] = source
+        else:
+            request["path"] = os.path.abspath(path)
+        self.socket.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        return json.loads(self.responses.readline())
+
+    def close(self):
+        self.responses.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(
+        prog="analyzer.daemon", description="Analyze programs in a long-running process")
+    commands = arguments.add_subparsers(dest="command", required=True)
+    serve_arguments = commands.add_parser("serve", help="run the daemon")
+    serve_arguments.add_argument("-j", "--workers", type=int, default=None)
+    analyze_arguments = commands.add_parser("analyze", help="send files to a running daemon")
+    analyze_arguments.add_argument("paths", nargs="+")
+    analyze_arguments.add_argument("--lexer", choices=["loop", "regex"], default="loop")
+    analyze_arguments.add_argument("--parser", choices=["recursive", "ll1"], default="recursive")
+    analyze_arguments.add_argument("--recover", action="store_true")
+    for command in (serve_arguments, analyze_arguments):
+        command.add_argument("--socket", help="Unix socket path; without it, localhost TCP is used")
+        command.add_argument("--host", default="127.0.0.1")
+        command.add_argument("--port", type=int, default=8765)
+    options = arguments.parse_args(argv)
+
+    if options.command == "serve":
+        with contextlib.suppress(KeyboardInterrupt, asyncio.CancelledError):
+            asyncio.run(serve(options.socket, options.host, options.port, options.workers))
+        return 0
+    failed = 0
+    with DaemonClient(options.socket, options.host, options.port) as client:
+        for path in options.paths:
+            response = client.analyze(path=path, lexer=options.lexer, parser=options.parser,
+                                      recover=options.recover)
+            print(json.dumps({"path": path, **response}))
+            failed += not response.get("parsed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+import argparse
+import contextlib
+import json
+import mmap
+import os
+import sys
+from json.encoder import encode_basestring_ascii
+
+from .lexer import TokenCursor, get_scanner_patterns, iter_tokens, lexer_engines, scan_offsets, token_kinds
+from .parser import ParseError, parse_next_statement
+from .tree import statement_node_kinds
+
+# Lines are handed to the output once this many characters have collected
+default_chunk_size = 1 << 20
+
+
+# Writes JSON Lines to a binary stream in chunks of about chunk_size, so a
+# large export makes few large writes instead of one per record
+class JsonLinesWriter:
+    def __init__(self, stream, chunk_size=default_chunk_size):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.lines = []
+        self.size = 0
+
+    # line is one JSON object, without the newline
+    def write(self, line):
+        self.lines.append(line)
+        self.size += len(line) + 1
+        if self.size >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            self.lines.append("")
+            self.stream.write("\n".join(self.lines).encode("utf-8"))
+            self.lines = []
+            self.size = 0
+        self.stream.flush()
+
+
+# The "type" and "class_type" members of a token record for every kind,
+# already encoded
+token_kind_fields = [f'"type": {json.dumps(token_type)}, "class_type": {json.dumps(class_type)}'
+                     for token_type, class_type in token_kinds]
+
+
+# Write a record for every token of source as the lexer produces it: id,
+# type, class_type, lexeme, line and offset. source is a str, or bytes or an
+# mmap, which are lexed with the regex engine and have byte offsets. Returns
+# the number of tokens.
+def export_tokens(source, writer, engine="loop"):
+    binary = not isinstance(source, str)
+    if binary:
+        lexemes = scan_offsets(source, get_scanner_patterns(binary=True))
+    else:
+        lexemes = lexer_engines[engine](source)
+    token_id = 0
+    for token_id, (start, end, kind, line_number) in enumerate(lexemes, 1):
+        lexeme = source[start:end]
+        if binary:
+            lexeme = lexeme.decode("utf-8", "replace")
+        writer.write(f'{{"id": {token_id}, {token_kind_fields[kind]}, "lexeme": {encode_basestring_ascii(lexeme)}, '
+                     f'"line": {line_number}, "offset": {start}}}')
+    return token_id
+
+
+# Lex and parse code_input together, through a cursor so that only a few
+# tokens are held at a time, and write a record for each statement as it is
+# parsed: its number, node kind, first and last token index and line. The
+# last record is the result: parsed, or the first syntax error with the
+# index and line of the token it was found at. Returns the number of
+# statements.
+def export_statements(code_input, writer, engine="loop"):
+    tokens = TokenCursor(iter_tokens(code_input, engine))
+    index = 0
+    count = 0
+    while True:
+        try:
+            token = tokens[index]
+            next_index = parse_next_statement(tokens, index, count == 0)
+        except SyntaxError as e:
+            error_index = e.index if isinstance(e, ParseError) else index
+            writer.write(json.dumps({"result": "syntax_error", "message": str(e).strip(), "token": error_index,
+                                     "line": tokens[error_index].line_number, "statements": count}))
+            return count
+        except IndexError:
+            line_number = tokens[tokens.fetched - 1].line_number if tokens.fetched else None
+            writer.write(json.dumps({"result": "syntax_error", "message": "Make sure the program ends with 'end'",
+                                     "token": index, "line": line_number, "statements": count}))
+            return count
+        if next_index is None:
+            writer.write(json.dumps({"result": "parsed", "statements": count}))
+            return count
+        count += 1
+        writer.write(f'{{"statement": {count}, "kind": "{statement_node_kinds[token.kind].name}", '
+                     f'"first": {index}, "last": {next_index - 1}, "line": {token.line_number}}}')
+        index = next_index
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(
+        prog="analyzer.export", description="Stream tokens or statements of a file as JSON Lines")
+    arguments.add_argument("input_path")
+    arguments.add_argument("--records", choices=["tokens", "statements"], default="tokens")
+    arguments.add_argument("--input-mode", choices=["read", "mmap"], default="read",
+                           help="mmap lexes tokens straight from a memory map with the regex engine")
+    arguments.add_argument("--lexer", choices=["loop", "regex"], default="loop")
+    arguments.add_argument("--output", help="write to this file instead of stdout")
+    arguments.add_argument("--chunk-size", type=int, default=default_chunk_size)
+    options = arguments.parse_args(argv)
+
+    # The writer makes large writes of its own, so the file needs no buffer
+    stream = open(options.output, "wb", buffering=0) if options.output else sys.stdout.buffer
+    writer = JsonLinesWriter(stream, options.chunk_size)
+    # The lexer's messages about invalid characters go to stderr, not among
+    # the records
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            if options.records == "tokens" and options.input_mode == "mmap":
+                with open(options.input_path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        source = b""
+                    else:
+                        source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                export_tokens(source, writer)
+            else:
+                with open(options.input_path) as f:
+                    code_input = f.read()
+                if options.records == "tokens":
+                    export_tokens(code_input, writer, options.lexer)
+                else:
+                    export_statements(code_input, writer, options.lexer)
+        writer.flush()
+    finally:
+        if options.output:
+            stream.close()
+
+
+if __name__ == "__main__":
+    main()
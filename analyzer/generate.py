@@ -0,0 +1,91 @@
+import random
+import re
+
+# Statement templates for the constructs of the CFGs grammar, written so that
+# parse_program accepts every one of them in any order, and how many
+# statements the parser counts in each. {v}, {f}, {c}, {o} and {n} are filled
+# in with a variable, function, class, object and numeral.
+statement_templates = [
+    (["{v} = {v}", "{v} = {n}", "{v} = 2.5", '{v} = "text"'], 1),
+    (["while {v} == {v} :", "while {v} >= {v} :", "while {v} != {v} :"], 1),
+    (["for {v} in range ( {v} , {v} ) :"], 1),
+    (["if ( {v} == {v} ) :", "elif ( {v} != {v} ) :", "else :"], 1),
+    (['print ( "hello world" )', "print ( {v} , {v} )", "print ( {v} )"], 1),
+    (["def {f} ( {v} , {v} ) :", "def {f} ( ) :"], 1),
+    (["function_call {f} ( {v} , {v} ) :", "function_call {f} ( ) :"], 1),
+    # The class header takes its __init__ with it; the self line is its own
+    (["class {c} :\n    def __init__ ( self , {v} ) :\n        self . {v} = {v}"], 2),
+    (["object_call {o} = {c} ( {v} , {n} )"], 1),
+    (["return add {v} , {v}", "return sub {v} , {v}", "return mul {v} , {v}",
+      "return div {v} , {v}", "return {v}"], 1),
+    (['{v} = input ( "value" )'], 1),
+    (["++ {v} :", "-- {v} :"], 1),
+]
+
+
+# First words of the statements that open a body
+block_keywords = frozenset({"while", "for", "if", "elif", "else", "def", "class"})
+
+
+# The innermost level whose last statement is an if or elif with a body, which
+# an elif or else can continue, or None
+def branch_level(opened):
+    for level in range(len(opened) - 1, -1, -1):
+        if opened[level] in ("if", "elif") and (level + 1 == len(opened) or opened[level + 1] is not None):
+            return level
+    return None
+
+
+# A valid program of about size bytes, the same for the same seed. Returns
+# the text and the number of statements parse_program will see in it.
+def generate_program(size, seed=0):
+    rng = random.Random(seed)
+    names = {
+        "v": [f"v{number}" for number in range(64)],
+        "f": [f"f{number}" for number in range(16)],
+        "c": [f"C{number}" for number in range(8)],
+        "o": [f"o{number}" for number in range(8)],
+        "n": [f"{number}+" for number in range(10)],
+    }
+
+    def fill(match):
+        return rng.choice(names[match.group(1)])
+
+    lines = []
+    length = 0
+    statements = 0
+    # The tree and symbol table nest statements by their column, so the
+    # program is indented the way it is meant to nest: the body of a block
+    # header is one level further in and ends after a random number of
+    # statements, and elif and else go back to the level of the if or elif
+    # they continue. opened holds the first word of the last statement at
+    # each level up to the current one, None for a body still empty.
+    depth = 0
+    opened = [None]
+    while length < size:
+        templates, count = rng.choice(statement_templates)
+        text = re.sub(r"\{(\w)\}", fill, rng.choice(templates))
+        if text.startswith(("elif", "else")):
+            level = branch_level(opened)
+            if level is None:
+                continue
+            depth = level
+            del opened[level + 1:]
+        for line in text.split("\n"):
+            statement = line.lstrip(" ")
+            level = depth + (len(line) - len(statement)) // 4
+            lines.append("    " * level + statement)
+            length += len(lines[-1]) + 1
+            del opened[level:]
+            opened.append(statement.split(" ", 1)[0])
+        statements += count
+        depth = level
+        if opened[-1] in block_keywords:
+            depth += 1
+            opened.append(None)
+        else:
+            while depth and rng.random() < 0.5:
+                depth -= 1
+                opened.pop()
+    lines.append("end")
+    return "\n".join(lines) + "\n", statements
@@ -0,0 +1,715 @@
+import mmap
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from collections import deque
+from enum import IntEnum
+
+from .symbols import InternTable
+
+
+class Node:
+    def __init__(self, line_num, token_id, lexeme, token_type, class_type):
+        self.line_num = line_num
+        self.token_id = token_id
+        self.lexeme = lexeme
+        self.token_type = token_type
+        self.class_type = class_type
+
+    def __iter__(self):
+        return iter((self.line_num, self.token_id, self.lexeme, self.token_type, self.class_type))
+
+
+# The token display, read straight from the columns of a TokenBuffer instead
+# of a second copy of every token
+class LinkedList:
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def __iter__(self):
+        buffer = self.buffer
+        for index in range(len(buffer)):
+            token_type, class_type = token_kinds[buffer.kinds[index]]
+            yield Node(buffer.lines[index], buffer.symbol_ids[index] or None,
+                       buffer.value(index), token_type, class_type)
+
+    def print_list(self):
+        for node in self:
+            print(node.lexeme, "->", (" "), node.token_type,
+                  (" "), "->", "Line", node.line_num)
+
+
+# Define regular expressions for each token
+datatypes_RE = r'\b(int|float|bool)\b'
+keywords_RE = r'\b(while|__init__|else|if|elif|input|print|return|def|class|self|in|range)\b'
+identifier_RE = r'\b[a-zA-Z_]\w*\b'
+numerals_RE = r'[0-9]+[+-]'
+flt_numeral_RE = r'[+-]?[0-9]+\.[0-9]+'
+#special_characters_RE = r'[*<,>:\']'
+
+# Define a list of tuples to store the token pattern and its corresponding type
+
+token_patterns = [
+    (r'<', 'less', 'operator'),
+    (r'\n', 'newline', 'separator'),
+    (r'end', 'end', 'keyword'),
+    (r'\t', 'tab', 'separator'),
+    (r'>', 'gt', 'operator'),
+    (r'\badd\b', 'add', 'operator'),
+    (r'\bsub\b', 'sub', 'operator'),
+    (r'\bmul\b', 'mul', 'operator'),
+    (r'\bdiv\b', 'div', 'operator'),
+    (r'\bmod\b', 'mod', 'operator'),
+    (r'<=', 'lesseq', 'operator'),
+    (r'>=', 'gteq', 'operator'),
+    (r'==', 'eq', 'operator'),
+    (r'!=', 'noteq', 'operator'),
+    (r':', 'colon', 'separator'),
+    (r'\bint\b', 'int', 'datatype'),
+    (r'\bfloat\b', 'float', 'datatype'),
+    (r'\bbool\b', 'bool', 'datatype'),
+    (r'\bif\b', 'if', None),
+    (r'\belif\b', 'elif', None),
+    (r'"', 'double quote', 'delimiter'),
+    (r'\belse\b', 'else', None),
+    (r'\bwhile\b', 'while', None),
+    (r'\bfor\b', 'for', None),
+    (r'\breturn\b','return', None),
+    (r'\bdef\b', 'def', None),
+    #(r'\.', 'dot', 'operator'),
+    (r'\bthis.\b', 'this.', None),
+    (r'\bfunction_call\b','function_call', None),
+    (r'\bobject_call\b','object_call', None),
+    (r'\bprint\b', 'print', None),
+    (r'\binput\b', 'input', None),
+    (r'\bself\b', 'self', None),
+    (r'\bin\b', 'in', None),
+    (r'\brange\b', 'range', None),
+    (r'\bclass\b', 'class', None),
+    (r'\b__init__\b', '__init__', None),
+    (r'\+\+', 'inc', None),
+    (r'--', 'dec', None),
+    (identifier_RE, 'identifier', 'identifier'),
+    (numerals_RE, 'numeral', 'literal'),
+    (flt_numeral_RE, 'flt_numeral', 'literal'),
+    #(special_characters_RE, 'special_char', None),
+    (r'\+', 'operator', 'operator'),
+    (r'-', 'operator', 'operator'),
+    (r'\*', 'operator', 'operator'),
+    (r'/', 'operator', 'operator'),
+    (r'%', 'operator', 'operator'),
+    (r'=', 'assignment_operator', 'operator'),
+    (r'\(', 'lparen', 'separator'),
+    (r'\)', 'rparen', 'separator'),
+    (r'{', 'l_brace', 'separator'),
+    (r'}', 'r_brace', 'separator'),
+    (r'\[', 'l_bracket', 'separator'),
+    (r']', 'r_bracket', 'separator'),
+    (r',', 'comma', 'separator'),
+    (r'\'', 'apostrophe', 'delimiter'),
+    (r'[()\[\]{}]', 'bracket', 'separator'),
+    (r'\n', 'newline', 'separator'),
+    (r'\s+', None, None),
+    (r'\.', 'dot', 'delimiter'),
+    (r"\n", None, None),
+    (r"[+\-*/=<>!%&|?^~:;,.(){}\[\]@#]", None, None),
+    (r'<', 'operator', 'operator'),
+    (r'>', 'operator', 'operator'),
+    (r'==', 'operator', 'operator'),
+    (r'<=', 'operator', 'operator'),
+    (r'>=', 'operator', 'operator'),
+    (r'!=', 'operator', 'operator'),
+    (r'true', 'boolean', 'literal'),
+    (r'false', 'boolean', 'literal'),
+    (r"'(?:\\.|[^'])*'", 'string', 'literal'),
+    (r'"(?:\\.|[^"])*"', 'string', 'literal'),
+
+]
+
+# Token types as small integers. The lexer assigns one to every token, so the
+# parser can dispatch on ints instead of comparing type strings.
+class TokenType(IntEnum):
+    LESS = 0
+    NEWLINE = 1
+    END = 2
+    TAB = 3
+    GT = 4
+    ADD = 5
+    SUB = 6
+    MUL = 7
+    DIV = 8
+    MOD = 9
+    LESSEQ = 10
+    GTEQ = 11
+    EQ = 12
+    NOTEQ = 13
+    COLON = 14
+    INT = 15
+    FLOAT = 16
+    BOOL = 17
+    IF = 18
+    ELIF = 19
+    DOUBLE_QUOTE = 20
+    ELSE = 21
+    WHILE = 22
+    FOR = 23
+    RETURN = 24
+    DEF = 25
+    THIS = 26
+    FUNCTION_CALL = 27
+    OBJECT_CALL = 28
+    PRINT = 29
+    INPUT = 30
+    SELF = 31
+    IN = 32
+    RANGE = 33
+    CLASS = 34
+    INIT = 35
+    INC = 36
+    DEC = 37
+    IDENTIFIER = 38
+    NUMERAL = 39
+    FLT_NUMERAL = 40
+    OPERATOR = 41
+    ASSIGNMENT_OPERATOR = 42
+    LPAREN = 43
+    RPAREN = 44
+    L_BRACE = 45
+    R_BRACE = 46
+    L_BRACKET = 47
+    R_BRACKET = 48
+    COMMA = 49
+    APOSTROPHE = 50
+    BRACKET = 51
+    UNKNOWN = 52
+    DOT = 53
+    BOOLEAN = 54
+    STRING = 55
+    STRING_LITERAL = 56
+    # Checked for by the parser, never produced by the lexer
+    NUMBER = 57
+
+
+# 'double quote' -> DOUBLE_QUOTE, '__init__' -> INIT, None -> UNKNOWN
+def token_type_member(token_type):
+    if token_type is None:
+        return TokenType.UNKNOWN
+    return TokenType[token_type.strip("_.").replace(" ", "_").upper()]
+
+
+# The type string and class type of every TokenType, indexed by its value
+def build_token_kinds():
+    token_kinds = [None] * len(TokenType)
+    for _, token_type, class_type in token_patterns + [(None, "string_literal", "literal"),
+                                                        (None, "number", None)]:
+        token_kinds[token_type_member(token_type)] = (token_type, class_type)
+    return token_kinds
+
+
+token_kinds = build_token_kinds()
+kind_members = list(TokenType)
+kind_ids = {token_type: kind for kind, (token_type, _) in zip(TokenType, token_kinds)}
+
+# Compile all the token patterns once into a single alternation. Each pattern
+# gets its own named group and the groups keep the list order, so the first
+# pattern that matches still wins.
+pattern_kinds = {f"t{position}": kind_ids[token_type]
+                 for position, (_, token_type, _) in enumerate(token_patterns)}
+
+
+# The original lexer matches at the start of the remaining line, where a
+# leading \b always holds. pattern.match(text, pos) also looks at the character
+# before pos, so the leading \b is dropped for in-place matching.
+def strip_leading_boundary(pattern):
+    if pattern.startswith(r'\b'):
+        return pattern[2:]
+    return pattern
+
+
+# The compiled patterns used by the in-place scanner, either for str input or,
+# with binary=True, for bytes and memory mapped files
+class ScannerPatterns:
+    def __init__(self, binary=False):
+        self.binary = binary
+        self.master = self.compile("|".join(
+            f"(?P<t{position}>{strip_leading_boundary(pattern)})"
+            for position, (pattern, _, _) in enumerate(token_patterns)))
+        self.whitespace = self.compile(r'\s*')
+        self.newline = self.encode("\n")
+        # Group name of the quote tokens -> pattern for the rest of the literal
+        self.quotes = {}
+        for position, (_, token_type, _) in enumerate(token_patterns):
+            if token_type in ['double quote', 'apostrophe']:
+                quote_char = '"' if token_type == 'double quote' else "'"
+                self.quotes[f"t{position}"] = (self.encode(quote_char), self.compile(
+                    rf"[^{quote_char}\\]+(?:\\.[^{quote_char}\\]+)*{quote_char}"))
+
+    def encode(self, text):
+        return text.encode() if self.binary else text
+
+    def compile(self, pattern):
+        return re.compile(self.encode(pattern))
+
+    def decode(self, text):
+        return text.decode("utf-8", "replace") if self.binary else text
+
+
+scanner_patterns = {}
+
+
+# The str (or, with binary=True, bytes) patterns, compiled the first time a
+# scanner needs them so that importing the lexer stays cheap
+def get_scanner_patterns(binary=False):
+    if binary not in scanner_patterns:
+        scanner_patterns[binary] = ScannerPatterns(binary)
+    return scanner_patterns[binary]
+
+
+class Token:
+    def __init__(self, id, value, type, class_type, line_number, kind=None, symbol_id=None):
+        self.id = id
+        self.value = value
+        self.type = type
+        self.class_type = class_type
+        self.line_number = line_number
+        self.kind = kind_ids[type] if kind is None else kind
+        self.symbol_id = symbol_id
+
+    def __str__(self):
+        return f"{self.value} ({self.id}, {self.value}, {self.type}, {self.class_type}, {self.line_number})"
+
+        ### new###
+
+
+# A token that points into a memory mapped source instead of holding a copy
+# of its lexeme
+class MappedToken(Token):
+    def __init__(self, id, source, start, end, type, class_type, line_number, kind=None, symbol_id=None):
+        self.id = id
+        self.source = source
+        self.start = start
+        self.end = end
+        self.type = type
+        self.class_type = class_type
+        self.line_number = line_number
+        self.kind = kind_ids[type] if kind is None else kind
+        self.symbol_id = symbol_id
+
+    @property
+    def value(self):
+        return self.source[self.start:self.end].decode("utf-8", "replace")
+
+
+# Tokens stored column by column, one array('I') each for the kind, start
+# offset, end offset, line number and interned identifier id (0 for other
+# tokens). A Token is only made when one is read, as a view on the source.
+class TokenBuffer:
+    def __init__(self, source, binary=False, symbols=None):
+        self.source = source
+        self.binary = binary
+        self.symbols = InternTable() if symbols is None else symbols
+        self.kinds = array('I')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.lines = array('I')
+        self.symbol_ids = array('I')
+        # Offset of the start of every line, worked out the first time a
+        # position is asked for
+        self.line_starts = None
+
+    def append(self, start, end, kind, line_number):
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line_number)
+        if kind == TokenType.IDENTIFIER:
+            name = self.source[start:end]
+            self.symbol_ids.append(self.symbols.intern(name.decode() if self.binary else name))
+        else:
+            self.symbol_ids.append(0)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def value(self, index):
+        symbol_id = self.symbol_ids[index]
+        if symbol_id:
+            return self.symbols.names[symbol_id]
+        value = self.source[self.starts[index]:self.ends[index]]
+        return value.decode("utf-8", "replace") if self.binary else value
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        kind = kind_members[self.kinds[index]]
+        token_type, class_type = token_kinds[kind]
+        symbol_id = self.symbol_ids[index] or None
+        if self.binary and not symbol_id:
+            return MappedToken(index + 1, self.source, self.starts[index], self.ends[index],
+                               token_type, class_type, self.lines[index], kind)
+        return Token(index + 1, self.value(index), token_type, class_type,
+                     self.lines[index], kind, symbol_id)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    # 1-based line and column of an offset into the source
+    def line_column(self, offset):
+        if self.line_starts is None:
+            self.line_starts = line_start_offsets(self.source, b"\n" if self.binary else "\n")
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+    # Line and column of the token at index
+    def position(self, index):
+        return self.line_column(self.starts[index])
+
+
+# Offsets where the lines of source start, in order. source is a str, bytes
+# or mmap, with newline to match.
+def line_start_offsets(source, newline="\n"):
+    line_starts = array('I', [0])
+    offset = source.find(newline)
+    while offset != -1:
+        line_starts.append(offset + 1)
+        offset = source.find(newline, offset + 1)
+    return line_starts
+
+
+line_matchers = []
+
+
+# The match function and kind of every token pattern, in order, for the line
+# scanner. Compiled on first use, like the scanner patterns.
+def get_line_matchers():
+    if not line_matchers:
+        line_matchers.extend((re.compile(pattern).match, kind_ids[token_type])
+                             for pattern, token_type, _ in token_patterns)
+    return line_matchers
+
+
+# Lex one line of the original engine: strip it, try every pattern in turn
+# and slice the matched lexeme off the front. line_offset is where the line
+# starts in the input, so the offsets of each lexeme are worked out from what
+# is left of the line. quote is None, or (quote_char, quote_start) when the
+# line starts inside a string literal. matchers is get_line_matchers().
+# Returns the lexemes and the quote state the next line starts in.
+def scan_line(line, line_number, line_offset, quote, matchers):
+    lexemes = []
+    line_end = line_offset + len(line.rstrip())
+    line = line.strip()
+    while line:
+        if quote is not None:
+            quote_char, quote_start = quote
+            match = re.search(
+                rf"[^{quote_char}\\]+(?:\\.[^{quote_char}\\]+)*{quote_char}", line)
+            if match:
+                start = line_end - len(line)
+                lexemes.append((start + match.start(), start + match.end(), TokenType.STRING_LITERAL, line_number))
+                line = line[match.end():].lstrip()
+                quote = None
+            else:
+                invalid_literal = line[quote_start:]
+                print(
+                    f"Invalid string literal: {invalid_literal} at line number {line_number}")
+                line = ""
+        else:
+            match = None
+            for match_pattern, kind in matchers:
+                match = match_pattern(line)
+                if match:
+                    start = line_end - len(line)
+                    lexemes.append((start, start + match.end(), kind, line_number))
+                    line = line[match.end():].lstrip()
+                    break
+            if not match:
+                invalid_char = re.match(r'\S', line)
+                if invalid_char:
+                    print(
+                        f"Invalid character: {invalid_char.group(0)} at line number {line_number}")
+                line = ""
+            elif match.group(0) in ['"', "'"]:
+                quote_char = match.group(0)
+                quote = (quote_char, len(line) - len(line.lstrip(quote_char)))
+    return lexemes, quote
+
+
+# Lex code_input line by line from line_offset, which must be the start of
+# line line_number, entering it in the given quote state. Yields the start
+# offset, the quote state at the start and the lexemes of every line.
+def scan_line_states(code_input, line_offset=0, line_number=1, quote=None):
+    matchers = get_line_matchers()
+    while True:
+        line_end = code_input.find("\n", line_offset)
+        if line_end == -1:
+            line_end = len(code_input)
+        lexemes, next_quote = scan_line(code_input[line_offset:line_end], line_number, line_offset, quote,
+                                        matchers)
+        yield line_offset, quote, lexemes
+        if line_end == len(code_input):
+            return
+        quote = next_quote
+        line_offset = line_end + 1
+        line_number += 1
+
+
+# The original lexer engine, one line after another
+def scan_lines(code_input):
+    for _, _, lexemes in scan_line_states(code_input):
+        yield from lexemes
+
+
+# Match the master pattern in place with a position cursor over the whole
+# source, which may be a str, bytes or an mmap. Nothing is sliced, so long
+# lines lex in linear time. Line numbers come from counting the newlines the
+# cursor skips over, from line_number at the start of source. Yields the
+# offsets of each lexeme rather than a copy, and returns whether the source
+# ends inside a string literal.
+def scan_offsets(source, patterns, line_number=1):
+    inside_quotes = False
+    quote_char = None
+    quote_pattern = None
+    quote_start = None
+    line_end = -1
+    pos = 0
+    end = len(source)
+    while True:
+        skipped = patterns.whitespace.match(source, pos).end()
+        if skipped != pos:
+            line_number += source[pos:skipped].count(patterns.newline)
+            pos = skipped
+        if pos >= end:
+            break
+        if pos > line_end:
+            line_end = source.find(patterns.newline, pos)
+            if line_end == -1:
+                line_end = end
+        if inside_quotes:
+            match = quote_pattern.search(source, pos, line_end)
+            if match:
+                yield match.start(), match.end(), TokenType.STRING_LITERAL, line_number
+                pos = match.end()
+                inside_quotes = False
+                quote_char = None
+            else:
+                invalid_literal = patterns.decode(source[pos:line_end].rstrip()[quote_start:])
+                print(
+                    f"Invalid string literal: {invalid_literal} at line number {line_number}")
+                pos = line_end
+        else:
+            match = patterns.master.match(source, pos, line_end)
+            if not match:
+                invalid_char = patterns.decode(source[pos:pos + 4])[0]
+                print(
+                    f"Invalid character: {invalid_char} at line number {line_number}")
+                pos = line_end
+                continue
+            yield pos, match.end(), pattern_kinds[match.lastgroup], line_number
+            pos = match.end()
+            if match.lastgroup in patterns.quotes:
+                inside_quotes = True
+                quote_char, quote_pattern = patterns.quotes[match.lastgroup]
+                rest = patterns.whitespace.match(source, pos).end()
+                quote_start = 0
+                while rest + quote_start < line_end and source[rest + quote_start:rest + quote_start + 1] == quote_char:
+                    quote_start += 1
+    return inside_quotes
+
+
+# The regex engine for tokenize(): in-place scanning of a str
+def scan_buffer(code_input):
+    return scan_offsets(code_input, get_scanner_patterns())
+
+
+lexer_engines = {
+    "loop": scan_lines,
+    "regex": scan_buffer,
+}
+
+
+# Lex a whole string into a TokenBuffer. Nothing is printed; the command
+# line shows the buffer with LinkedList(tokens).print_list().
+def tokenize(code_input, engine="loop"):
+    tokens = TokenBuffer(code_input)
+    for start, end, kind, line_number in lexer_engines[engine](code_input):
+        tokens.append(start, end, kind, line_number)
+    return tokens
+
+
+# Yield each Token as soon as the scanner produces it, without building the
+# token list, linked list or symbol table. Identifiers are interned through
+# symbols, which can be shared with other streams and buffers.
+def iter_tokens(code_input, engine="loop", symbols=None):
+    if symbols is None:
+        symbols = InternTable()
+    lexemes = lexer_engines[engine](code_input)
+    for id_counter, (start, end, kind, line_number) in enumerate(lexemes, 1):
+        kind = kind_members[kind]
+        token_type, class_type = token_kinds[kind]
+        value = code_input[start:end]
+        symbol_id = None
+        if kind == TokenType.IDENTIFIER:
+            symbol_id = symbols.intern(value)
+            value = symbols.names[symbol_id]
+        yield Token(id_counter, value, token_type, class_type, line_number, kind, symbol_id)
+
+
+# Lex a file straight from a memory map of it with the bytes patterns. The
+# token buffer keeps offsets into the mapping and its tokens only decode their
+# value when it is read, so no copy of the source text is made.
+def tokenize_mmap(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return TokenBuffer(b"", binary=True)
+        source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    tokens = TokenBuffer(source, binary=True)
+    for start, end, kind, line_number in scan_offsets(source, get_scanner_patterns(binary=True)):
+        tokens.append(start, end, kind, line_number)
+    return tokens
+
+
+# column, an array('I'), with delta added to every value; column itself when
+# delta is 0. The values are added all at once as one big integer in native
+# byte order: adding delta repeated in every 4 bytes cannot carry from one
+# value into the next because no shifted value leaves the range of the
+# column. This runs in C where a generator would add one value at a time.
+def shift_column(column, delta):
+    if not delta or not column:
+        return column
+    step = int.from_bytes((array('I', [abs(delta)]) * len(column)).tobytes(), sys.byteorder)
+    values = int.from_bytes(column.tobytes(), sys.byteorder)
+    values = values + step if delta > 0 else values - step
+    shifted = array('I')
+    shifted.frombytes(values.to_bytes(len(column) * column.itemsize, sys.byteorder))
+    return shifted
+
+
+# Keeps a text and its TokenBuffer up to date as the text is edited. Only the
+# quote state carries from one line to the next, so an edit is re-lexed from
+# the start of its first line until a line starts in the same quote state as
+# it did before the edit. Every token after that is the old token with its
+# offsets and line number shifted; token ids follow from the buffer index.
+class IncrementalLexer:
+    def __init__(self, code_input, symbols=None):
+        self.source = code_input
+        self.tokens = TokenBuffer(code_input, symbols=symbols)
+        # Per line: start offset, index of its first token and the quote state
+        # it starts in
+        self.line_starts = array('I')
+        self.line_tokens = array('I')
+        self.line_states = []
+        for line_offset, quote, lexemes in scan_line_states(code_input):
+            self.line_starts.append(line_offset)
+            self.line_tokens.append(len(self.tokens))
+            self.line_states.append(quote)
+            for start, end, kind, line_number in lexemes:
+                self.tokens.append(start, end, kind, line_number)
+        self.tokens.line_starts = self.line_starts
+
+    # Replace removed characters at offset with inserted. Returns the index of
+    # the first token that changed, how many old tokens were replaced and how
+    # many new ones took their place; self.tokens is the new buffer.
+    def edit(self, offset, removed, inserted):
+        old_tokens = self.tokens
+        old_lines = len(self.line_starts)
+        source = self.source[:offset] + inserted + self.source[offset + removed:]
+        first_line = bisect_right(self.line_starts, offset) - 1
+        last_line = bisect_right(self.line_starts, offset + removed) - 1
+        line_delta = inserted.count("\n") - (last_line - first_line)
+        shift = len(inserted) - removed
+
+        first_token = self.line_tokens[first_line]
+        tokens = TokenBuffer(source, symbols=old_tokens.symbols)
+        for column in ("kinds", "starts", "ends", "lines", "symbol_ids"):
+            setattr(tokens, column, getattr(old_tokens, column)[:first_token])
+        line_starts = self.line_starts[:first_line]
+        line_tokens = self.line_tokens[:first_line]
+        line_states = self.line_states[:first_line]
+        kept_line = old_lines
+        for line_offset, quote, lexemes in scan_line_states(
+                source, self.line_starts[first_line], first_line + 1, self.line_states[first_line]):
+            old_line = len(line_starts) - line_delta
+            if last_line < old_line < old_lines and quote == self.line_states[old_line]:
+                kept_line = old_line
+                break
+            line_starts.append(line_offset)
+            line_tokens.append(len(tokens))
+            line_states.append(quote)
+            for start, end, kind, line_number in lexemes:
+                tokens.append(start, end, kind, line_number)
+
+        kept_token = self.line_tokens[kept_line] if kept_line < old_lines else len(old_tokens)
+        inserted_tokens = len(tokens) - first_token
+        token_delta = inserted_tokens - (kept_token - first_token)
+        tokens.kinds.extend(old_tokens.kinds[kept_token:])
+        tokens.symbol_ids.extend(old_tokens.symbol_ids[kept_token:])
+        tokens.starts.extend(shift_column(old_tokens.starts[kept_token:], shift))
+        tokens.ends.extend(shift_column(old_tokens.ends[kept_token:], shift))
+        tokens.lines.extend(shift_column(old_tokens.lines[kept_token:], line_delta))
+        line_starts.extend(shift_column(self.line_starts[kept_line:], shift))
+        line_tokens.extend(shift_column(self.line_tokens[kept_line:], token_delta))
+        line_states.extend(self.line_states[kept_line:])
+
+        self.source = source
+        tokens.line_starts = line_starts
+        self.tokens = tokens
+        self.line_starts = line_starts
+        self.line_tokens = line_tokens
+        self.line_states = line_states
+        return first_token, kept_token - first_token, inserted_tokens
+
+
+# A parser cursor over a stream of tokens. Only a small ring buffer of recent
+# and upcoming tokens is kept, so memory stays bounded however long the stream
+# is. peek/advance/expect move through the stream; tokens[index] also works
+# while index is still inside the buffer, which is how the parse_* functions
+# read it.
+class TokenCursor:
+    def __init__(self, tokens, window=16):
+        self.source = iter(tokens)
+        self.buffer = deque(maxlen=window)
+        self.fetched = 0
+        self.index = 0
+
+    def __getitem__(self, index):
+        while self.fetched <= index:
+            token = next(self.source, None)
+            if token is None:
+                raise IndexError("token index out of range")
+            self.buffer.append(token)
+            self.fetched += 1
+        offset = index - (self.fetched - len(self.buffer))
+        if offset < 0:
+            raise RuntimeError(f"Token {index} is no longer in the cursor window")
+        return self.buffer[offset]
+
+    def at_end(self, index=None):
+        try:
+            self[self.index if index is None else index]
+        except IndexError:
+            return True
+        return False
+
+    def peek(self, offset=0):
+        return self[self.index + offset]
+
+    def advance(self):
+        token = self[self.index]
+        self.index += 1
+        return token
+
+    def expect(self, kind, message):
+        token = self.peek()
+        if token.kind != kind:
+            raise SyntaxError(message)
+        return self.advance()
+
+
+# True when index is past the last token of a list, TokenBuffer or TokenCursor
+def at_end(tokens, index):
+    if isinstance(tokens, TokenCursor):
+        return tokens.at_end(index)
+    return index >= len(tokens)
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+import tempfile
+
+EPSILON = "E"
+END_OF_INPUT = "$"
+
+
+# Read a grammar file. A rule is "<name> -> alternative | alternative" and may
+# carry on over following lines that start with "|". Text after "#" is a
+# comment. <names> are nonterminals, E is the empty string and any other
+# symbol is a terminal. The first rule's nonterminal is the start symbol.
+def load_grammar(text):
+    productions = {}
+    start = None
+    current = None
+    for line in text.split("\n"):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if "->" in line:
+            current, line = (part.strip() for part in line.split("->", 1))
+            if start is None:
+                start = current
+            productions.setdefault(current, [])
+        elif line.startswith("|") and current is not None:
+            line = line[1:]
+        else:
+            raise ValueError(f"Invalid grammar line: {line}")
+        for alternative in line.split("|"):
+            symbols = tuple(symbol for symbol in alternative.split() if symbol != EPSILON)
+            productions[current].append(symbols)
+    return start, productions
+
+
+def is_nonterminal(symbol):
+    return symbol.startswith("<")
+
+
+# FIRST of a sequence of symbols, with EPSILON in it if the whole sequence can
+# derive the empty string
+def first_of_sequence(symbols, first):
+    result = set()
+    for symbol in symbols:
+        if not is_nonterminal(symbol):
+            result.add(symbol)
+            return result
+        result |= first[symbol] - {EPSILON}
+        if EPSILON not in first[symbol]:
+            return result
+    result.add(EPSILON)
+    return result
+
+
+def compute_first(productions):
+    first = {nonterminal: set() for nonterminal in productions}
+    changed = True
+    while changed:
+        changed = False
+        for nonterminal, alternatives in productions.items():
+            for symbols in alternatives:
+                for symbol in symbols:
+                    if is_nonterminal(symbol) and symbol not in productions:
+                        raise ValueError(f"Undefined nonterminal {symbol} in {nonterminal}")
+                new = first_of_sequence(symbols, first) - first[nonterminal]
+                if new:
+                    first[nonterminal] |= new
+                    changed = True
+    return first
+
+
+def compute_follow(productions, start, first):
+    follow = {nonterminal: set() for nonterminal in productions}
+    follow[start].add(END_OF_INPUT)
+    changed = True
+    while changed:
+        changed = False
+        for nonterminal, alternatives in productions.items():
+            for symbols in alternatives:
+                for position, symbol in enumerate(symbols):
+                    if not is_nonterminal(symbol):
+                        continue
+                    rest = first_of_sequence(symbols[position + 1:], first)
+                    new = rest - {EPSILON}
+                    if EPSILON in rest:
+                        new |= follow[nonterminal]
+                    new -= follow[symbol]
+                    if new:
+                        follow[symbol] |= new
+                        changed = True
+    return follow
+
+
+# The predictive parse table: nonterminal -> lookahead terminal -> the
+# alternative to expand. Two alternatives starting with the same terminal mean
+# the grammar is not LL(1). An alternative that can be empty is only expanded
+# for the terminals of FOLLOW that no other alternative starts with, so an
+# optional part is taken whenever it can be, the way the recursive parser
+# takes an optional comma or operand as soon as it sees one.
+def build_parse_table(productions, start):
+    first = compute_first(productions)
+    follow = compute_follow(productions, start, first)
+    table = {nonterminal: {} for nonterminal in productions}
+    empty = []
+    for nonterminal, alternatives in productions.items():
+        row = table[nonterminal]
+        for symbols in alternatives:
+            lookaheads = first_of_sequence(symbols, first)
+            if EPSILON in lookaheads:
+                empty.append((nonterminal, symbols))
+            for terminal in lookaheads - {EPSILON}:
+                if terminal in row and row[terminal] != symbols:
+                    raise ValueError(
+                        f"Grammar is not LL(1): {nonterminal} has two alternatives for {terminal}")
+                row[terminal] = symbols
+    taken = {nonterminal: set(row) for nonterminal, row in table.items()}
+    for nonterminal, symbols in empty:
+        row = table[nonterminal]
+        for terminal in follow[nonterminal] - taken[nonterminal]:
+            if terminal in row and row[terminal] != symbols:
+                raise ValueError(
+                    f"Grammar is not LL(1): {nonterminal} has two alternatives for {terminal}")
+            row[terminal] = symbols
+    return table
+
+
+# Build the parse table for a grammar file, or load it from the JSON cache
+# next to it when the cache was built from the same grammar text
+def load_parse_table(grammar_path, cache_path=None):
+    if cache_path is None:
+        cache_path = grammar_path + ".cache.json"
+    with open(grammar_path, encoding="utf-8") as f:
+        text = f.read()
+    grammar_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["grammar_hash"] == grammar_hash:
+            table = {nonterminal: {terminal: tuple(symbols) for terminal, symbols in row.items()}
+                     for nonterminal, row in cached["table"].items()}
+            return cached["start"], table
+    except (OSError, ValueError, KeyError):
+        pass
+    start, productions = load_grammar(text)
+    table = build_parse_table(productions, start)
+    # Written to a temporary file and renamed over the cache, so that another
+    # process loading the table never reads half a file
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cache_path)), suffix=".tmp")
+    except OSError:
+        return start, table
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"grammar_hash": grammar_hash, "start": start,
+                       "table": {nonterminal: {terminal: list(symbols) for terminal, symbols in row.items()}
+                                 for nonterminal, row in table.items()}}, f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    return start, table
+
+
+# A table-driven predictive parser. terminals is the enum of token kinds whose
+# member names the grammar uses as terminals. Parsing stops as soon as the
+# start symbol has been matched, like the recursive parser stopping at end.
+class LL1Parser:
+    def __init__(self, grammar_path, terminals, cache_path=None):
+        self.start, self.table = load_parse_table(grammar_path, cache_path)
+        self.terminal_names = {member.value: member.name for member in terminals}
+        for row in self.table.values():
+            for symbols in row.values():
+                for symbol in symbols:
+                    if not is_nonterminal(symbol) and symbol not in terminals.__members__:
+                        raise ValueError(f"Unknown terminal {symbol} in {grammar_path}")
+
+    # tokens is a TokenCursor; returns the number of tokens consumed
+    def parse(self, tokens):
+        table = self.table
+        terminal_names = self.terminal_names
+        stack = [self.start]
+        while stack:
+            symbol = stack.pop()
+            if tokens.at_end():
+                token = None
+                lookahead = END_OF_INPUT
+            else:
+                token = tokens.peek()
+                lookahead = terminal_names[token.kind]
+            if not is_nonterminal(symbol):
+                if symbol != lookahead:
+                    raise SyntaxError(self.error(f"Expected {symbol}", token))
+                tokens.advance()
+                continue
+            symbols = table[symbol].get(lookahead)
+            if symbols is None:
+                expected = ", ".join(sorted(table[symbol]))
+                raise SyntaxError(self.error(f"Expected one of {expected} in {symbol}", token))
+            stack.extend(reversed(symbols))
+        return tokens.index
+
+    def error(self, message, token):
+        if token is None:
+            return f"{message} but the input ended"
+        return f"{message} but found {token.value!r} at line {token.line_number}"
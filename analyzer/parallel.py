@@ -0,0 +1,300 @@
+import contextlib
+import io
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .lexer import TokenBuffer, get_scanner_patterns, scan_line_states, scan_offsets, tokenize
+from .parser import recover_statements, statement_kinds
+from .symbols import InternTable
+from .tree import NodeKind, SyntaxTree
+
+# Below this many characters a chunk is not worth sending to a worker
+min_chunk_size = 64 * 1024
+
+quote_pattern = re.compile(r"""\\.|["']""")
+
+
+# Offsets where the chunks of code_input start: the start of the first line
+# after every chunk_size characters that a quick pass over the quote
+# characters says is outside a string literal. The pass only pairs each
+# quote with the next one of the same kind, so it can be wrong;
+# tokenize_parallel checks every boundary against the lexer itself.
+def chunk_starts(code_input, chunk_size):
+    starts = [0]
+    open_quote = None
+    scanned = 0
+    target = chunk_size
+    while target < len(code_input):
+        boundary = code_input.find("\n", target)
+        while boundary != -1:
+            for match in quote_pattern.finditer(code_input, scanned, boundary):
+                quote = match.group(0)
+                if open_quote is None:
+                    if len(quote) == 1:
+                        open_quote = quote
+                elif quote == open_quote:
+                    open_quote = None
+            scanned = boundary
+            if open_quote is None:
+                break
+            boundary = code_input.find("\n", boundary + 1)
+        if boundary == -1 or boundary + 1 >= len(code_input):
+            break
+        starts.append(boundary + 1)
+        target = boundary + 1 + chunk_size
+    return starts
+
+
+# Lex one chunk that starts at offset chunk_start and line first_line of the
+# input, as if it started outside a string literal. Returns the kinds,
+# starts, ends, lines and identifier names of its tokens, the id of each
+# identifier token in those names, the lexer's messages and whether the chunk
+# ends inside a string literal.
+def lex_chunk(chunk, chunk_start, first_line, engine="loop"):
+    tokens = TokenBuffer(chunk)
+    messages = io.StringIO()
+    with contextlib.redirect_stdout(messages):
+        if engine == "loop":
+            quote = None
+            for _, quote, lexemes in scan_line_states(chunk, 0, first_line):
+                for start, end, kind, line_number in lexemes:
+                    tokens.append(start, end, kind, line_number)
+            # A chunk ends with a newline, so the last line scanned is the
+            # empty one after it and quote is the state the next chunk starts in
+            inside_quotes = quote is not None
+        else:
+            lexemes = scan_offsets(chunk, get_scanner_patterns(), first_line)
+            while True:
+                try:
+                    start, end, kind, line_number = next(lexemes)
+                except StopIteration as stop:
+                    inside_quotes = stop.value
+                    break
+                tokens.append(start, end, kind, line_number)
+    return (tokens.kinds, array('I', (start + chunk_start for start in tokens.starts)),
+            array('I', (end + chunk_start for end in tokens.ends)), tokens.lines, tokens.symbols.names, tokens.symbol_ids, messages.getvalue(), inside_quotes)
+
+
+# Add a lex_chunk result to tokens. Its identifier ids are renumbered into
+# tokens.symbols in order, so every name keeps the id it has in a serial run.
+def append_chunk(tokens, result):
+    kinds, starts, ends, lines, names, symbol_ids, messages, _ = result
+    global_ids = [0] + [tokens.symbols.intern(name) for name in names[1:]]
+    tokens.kinds.extend(kinds)
+    tokens.starts.extend(starts)
+    tokens.ends.extend(ends)
+    tokens.lines.extend(lines)
+    tokens.symbol_ids.extend(array('I', map(global_ids.__getitem__, symbol_ids)))
+    if messages:
+        print(messages, end="")
+
+
+# tokenize() on a pool of worker processes. The input is cut into chunks at
+# line starts, each chunk is lexed in a worker and the results are joined
+# in order, with offsets, line numbers and identifier ids as one serial pass
+# would give them. The lexer only carries the string literal state from one
+# line to the next, so a chunk is right whenever the one before it ends
+# outside a string. When one does not, the two are lexed again as one chunk.
+# The tokens and messages are identical to tokenize(code_input, engine).
+def tokenize_parallel(code_input, engine="loop", workers=None, chunk_size=None):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(min_chunk_size, len(code_input) // (workers * 4) + 1)
+    starts = chunk_starts(code_input, chunk_size)
+    ends = starts[1:] + [len(code_input)]
+    first_lines = [1]
+    for start, end in zip(starts, ends[:-1]):
+        first_lines.append(first_lines[-1] + code_input.count("\n", start, end))
+
+    if workers <= 1 or len(starts) == 1:
+        return tokenize(code_input, engine)
+    tokens = TokenBuffer(code_input, symbols=InternTable())
+    with ProcessPoolExecutor(min(workers, len(starts))) as pool:
+        results = pool.map(lex_chunk, (code_input[start:end] for start, end in zip(starts, ends)),
+                           starts, first_lines, [engine] * len(starts))
+        pending_start = None
+        for chunk, result in enumerate(results):
+            if pending_start is not None:
+                # The chunks before this one end inside a string literal, so
+                # this one did not start where the worker assumed
+                result = lex_chunk(code_input[pending_start:ends[chunk]], pending_start,
+                                   pending_line, engine)
+            if result[-1] and chunk + 1 < len(starts):
+                if pending_start is None:
+                    pending_start, pending_line = starts[chunk], first_lines[chunk]
+                continue
+            append_chunk(tokens, result)
+            pending_start = None
+    return tokens
+
+
+# Below this many tokens a segment is not worth sending to a worker
+min_segment_tokens = 16 * 1024
+
+# The columns of a TokenBuffer in shared memory, in order, then its line
+# starts and its source
+shared_columns = ("kinds", "starts", "ends", "lines", "symbol_ids")
+
+# The token buffer a parse worker reads, attached by attach_tokens
+shared_tokens = []
+
+
+# The source text of a buffer in shared memory, encoded one (ASCII) or four
+# (UTF-32) bytes a character so that token offsets index it directly. The
+# source of a binary buffer is kept as it is, with encoding None.
+class SharedSource:
+    def __init__(self, data, width, encoding):
+        self.data = data
+        self.width = width
+        self.encoding = encoding
+
+    def __getitem__(self, key):
+        width = self.width
+        text = bytes(self.data[key.start * width:key.stop * width])
+        return text if self.encoding is None else text.decode(self.encoding)
+
+    def __len__(self):
+        return len(self.data) // self.width
+
+
+# Copy tokens, with its line starts and source, into one shared memory block.
+# Returns the block and the layout a worker needs to attach to it.
+def share_tokens(tokens):
+    tokens.line_column(0)
+    if tokens.binary:
+        source, width, encoding = tokens.source, 1, None
+    else:
+        try:
+            source, width, encoding = tokens.source.encode("ascii"), 1, "ascii"
+        except UnicodeEncodeError:
+            source, width, encoding = tokens.source.encode("utf-32-le"), 4, "utf-32-le"
+    columns = [column if isinstance(column, array) and column.typecode == 'I' else array('I', column)
+               for column in [getattr(tokens, name) for name in shared_columns] + [tokens.line_starts]]
+    sizes = [len(column) * 4 for column in columns] + [len(source)]
+    block = shared_memory.SharedMemory(create=True, size=max(1, sum(sizes)))
+    offset = 0
+    for data in columns + [source]:
+        size = len(data) * 4 if isinstance(data, array) else len(data)
+        block.buf[offset:offset + size] = memoryview(data).cast('B')
+        offset += size
+    return block, (block.name, sizes, width, encoding, tokens.symbols.names[1:])
+
+
+# Parse worker initializer: a TokenBuffer over the shared block, with the
+# identifier names it was sent
+def attach_tokens(name, sizes, width, encoding, names):
+    block = shared_memory.SharedMemory(name=name)
+    symbols = InternTable()
+    for symbol_name in names:
+        symbols.intern(symbol_name)
+    views = []
+    offset = 0
+    for size in sizes:
+        views.append(block.buf[offset:offset + size])
+        offset += size
+    tokens = TokenBuffer(SharedSource(views[-1], width, encoding), encoding is None, symbols)
+    for name, view in zip(shared_columns, views):
+        setattr(tokens, name, view.cast('I'))
+    tokens.line_starts = views[len(shared_columns)].cast('I')
+    shared_tokens[:] = [tokens, block]
+
+
+# recover_statements over the statements from start up to stop (None for the
+# rest of the program), with a tree of its own. Returns start, the index it
+# stopped at, whether the program is finished, the diagnostics and the tree
+# columns without the program node, with the program node's child count and
+# the last token of its last statement, None when it has none.
+def parse_segment(start, stop, first, tokens=None):
+    if tokens is None:
+        tokens = shared_tokens[0]
+    diagnostics = []
+    tree = SyntaxTree()
+    tree.begin(start)
+    index, finished = recover_statements(tokens, start, stop, first, diagnostics, None, tree)
+    tree.close()
+    return (start, index, finished, diagnostics, tree.kinds[1:], tree.firsts[1:], tree.lasts[1:],
+            tree.child_counts[1:], tree.child_counts[0], tree.last_statement)
+
+
+# Token indexes to cut tokens at for segments of about segment_size tokens:
+# each is the first token of a line with nothing before it on the line,
+# which is a top-level statement when the program is indented as it reads
+def segment_starts(tokens, segment_size):
+    starts = [0]
+    line_starts = tokens.line_starts
+    index = segment_size
+    while index < len(tokens):
+        if (tokens.kinds[index] in statement_kinds
+                and tokens.starts[index] == line_starts[tokens.lines[index] - 1]):
+            starts.append(index)
+            index += segment_size
+        else:
+            index += 1
+    return starts
+
+
+# recover_program(tokens, 0, tree=tree) on a pool of worker processes. The
+# token buffer is copied once into shared memory that every worker reads, and
+# the program is cut into segments at top-level statements. A statement only
+# depends on its own tokens, and one at column 1 closes every open block, so
+# a segment parses the same in a worker as in one serial pass, provided the
+# segment before it stopped exactly where it starts. When one runs past the
+# next one's start, such as a statement spread over the boundary or a
+# recovery that skipped over it, the two are parsed again as one segment in
+# this process. The diagnostics and tree fragments are joined in source
+# order. Returns the diagnostics, the same as recover_program's, and the
+# SyntaxTree when tree is true.
+def parse_parallel(tokens, workers=None, segment_size=None, tree=True):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if segment_size is None:
+        segment_size = max(min_segment_tokens, len(tokens) // (workers * 4) + 1)
+    tokens.line_column(0)
+    starts = segment_starts(tokens, segment_size)
+    syntax_tree = SyntaxTree()
+    diagnostics = []
+    syntax_tree.kinds.append(NodeKind.PROGRAM)
+    syntax_tree.firsts.append(0)
+    syntax_tree.lasts.append(0)
+    syntax_tree.child_counts.append(0)
+
+    def merge(result):
+        segment_diagnostics, kinds, firsts, lasts, child_counts, children, last_statement = result[3:]
+        diagnostics.extend(segment_diagnostics)
+        syntax_tree.kinds.extend(kinds)
+        syntax_tree.firsts.extend(firsts)
+        syntax_tree.lasts.extend(lasts)
+        syntax_tree.child_counts.extend(child_counts)
+        syntax_tree.child_counts[0] += children
+        if last_statement is not None:
+            syntax_tree.lasts[0] = last_statement
+
+    stops = starts[1:] + [None]
+    if workers <= 1 or len(starts) == 1:
+        merge(parse_segment(0, None, True, tokens))
+    else:
+        block, layout = share_tokens(tokens)
+        try:
+            with ProcessPoolExecutor(min(workers, len(starts)), initializer=attach_tokens,
+                                     initargs=layout) as pool:
+                results = pool.map(parse_segment, starts, stops, [start == 0 for start in starts])
+                # A result is held back until the next segment is known to
+                # start where it stopped
+                pending = next(results)
+                for start, stop, result in zip(starts[1:], stops[1:], results):
+                    if pending[2]:
+                        break
+                    if pending[1] != start:
+                        result = parse_segment(pending[0], stop, pending[0] == 0, tokens)
+                    else:
+                        merge(pending)
+                    pending = result
+                merge(pending)
+        finally:
+            block.close()
+            block.unlink()
+    return diagnostics, syntax_tree if tree else None
@@ -0,0 +1,1469 @@
+import contextlib
+import io
+import itertools
+import os
+import timeit
+from array import array
+from bisect import bisect_left
+from enum import IntEnum
+
+from .lexer import TokenBuffer, TokenCursor, TokenType, at_end, shift_column
+from .tree import NodeKind
+
+
+# How much the parser reports while it runs. Each level includes the ones
+# below it: summary is the outcome, rule adds every grammar rule entered and
+# token adds every token read.
+class TraceLevel(IntEnum):
+    OFF = 0
+    SUMMARY = 1
+    RULE = 2
+    TOKEN = 3
+
+
+# The tracer that ignores everything. Subclasses override the levels they
+# report; the parser checks trace_summary, trace_rules and trace_tokens before
+# calling, so nothing is formatted while tracing is off.
+class Tracer:
+    level = TraceLevel.OFF
+
+    def summary(self, *message):
+        pass
+
+    def rule(self, *message):
+        pass
+
+    def token(self, index, token, *extra):
+        pass
+
+
+# Prints the trace like the parser's own output always looked
+class PrintTracer(Tracer):
+    def __init__(self, level=TraceLevel.TOKEN):
+        self.level = TraceLevel(level)
+
+    def summary(self, *message):
+        print(*message)
+
+    def rule(self, *message):
+        print(*message)
+
+    def token(self, index, token, *extra):
+        print(index, token, *extra)
+
+
+tracer = Tracer()
+trace_summary = trace_rules = trace_tokens = False
+
+
+def set_tracer(new_tracer):
+    global tracer, trace_summary, trace_rules, trace_tokens
+    tracer = new_tracer
+    trace_summary = new_tracer.level >= TraceLevel.SUMMARY
+    trace_rules = new_tracer.level >= TraceLevel.RULE
+    trace_tokens = new_tracer.level >= TraceLevel.TOKEN
+
+
+# Parse without printing the verdict. Returns None when the program parses,
+# otherwise the SyntaxError, or the IndexError raised when the tokens run out
+# before end. The recursive parser declares what the program defines in
+# symbols, a SymbolTable, and adds its statements to tree, a SyntaxTree, when
+# they are given.
+def check_program(tokens, index=0, engine="recursive", symbols=None, tree=None):
+    # Anything that is not a list or buffer, such as iter_tokens(), is read through a
+    # bounded cursor as the parser goes, unless each statement has to be read
+    # again for its symbols or tree parts
+    if not isinstance(tokens, (list, TokenBuffer, TokenCursor)):
+        tokens = list(tokens) if symbols is not None or tree is not None else TokenCursor(tokens)
+    try:
+        if engine == "ll1":
+            if not isinstance(tokens, TokenCursor):
+                tokens = TokenCursor(itertools.islice(tokens, index, None))
+            get_ll1_parser().parse(tokens)
+        else:
+            parse_statements(tokens, index, symbols, tree)
+    except (SyntaxError, IndexError) as e:
+        if tree is not None:
+            tree.close()
+        return e
+    return None
+
+
+# The SyntaxError the parse_* functions raise, with the index of the token
+# they stopped at
+class ParseError(SyntaxError):
+    def __init__(self, message, index):
+        super().__init__(message)
+        self.index = index
+
+
+# Line and column of the token at index. Only a TokenBuffer knows where its
+# tokens start, so for other token sources the column is None.
+def token_position(tokens, index):
+    if isinstance(tokens, TokenBuffer):
+        return tokens.position(index)
+    return tokens[index].line_number, None
+
+
+# A syntax error found by recover_program, at the token index on line_number
+# and column. The token is the one the parser stopped at, or the last token
+# for an error at the end of the input.
+class Diagnostic:
+    def __init__(self, message, index, line_number, column=None):
+        self.message = message
+        self.index = index
+        self.line_number = line_number
+        self.column = column
+
+    def __str__(self):
+        if self.column is None:
+            return f"line {self.line_number}: {self.message}"
+        return f"line {self.line_number}, column {self.column}: {self.message}"
+
+
+# Keywords that only ever start a statement, so the parser can pick up again
+# at one wherever it appears
+sync_kinds = frozenset({TokenType.WHILE, TokenType.FOR, TokenType.PRINT, TokenType.IF, TokenType.ELIF,
+                        TokenType.ELSE, TokenType.CLASS, TokenType.DEF, TokenType.RETURN,
+                        TokenType.FUNCTION_CALL, TokenType.OBJECT_CALL, TokenType.INC, TokenType.DEC,
+                        TokenType.END})
+
+
+# Index of the first token after index, where a statement that started on
+# line_number failed, that the parser can start again at: a token that can
+# start a statement on a later line (the lexer drops line breaks, so a new
+# line stands in for the newline token), or one of sync_kinds anywhere.
+# With error_index past index the search starts at the token the error was
+# found at, so nothing the parser already read is parsed again.
+def synchronize(tokens, index, line_number, error_index=None):
+    if error_index is not None and error_index > index:
+        index = error_index
+    else:
+        index += 1
+    while not at_end(tokens, index):
+        token = tokens[index]
+        if token.kind in sync_kinds or (token.line_number > line_number and token.kind in statement_kinds):
+            return index
+        index += 1
+    return index
+
+
+# Panic-mode parse: record each syntax error, skip to the next
+# synchronization point and carry on, up to end. Running out of tokens is a
+# diagnostic at the end of the input rather than an IndexError. Returns
+# every Diagnostic, an empty list when the program parses. Statements that
+# parse declare their symbols and add their nodes to tree like check_program.
+def recover_program(tokens, index=0, symbols=None, tree=None):
+    if not isinstance(tokens, (list, TokenBuffer, TokenCursor)):
+        tokens = list(tokens) if symbols is not None or tree is not None else TokenCursor(tokens)
+    diagnostics = []
+    if tree is not None:
+        tree.begin(index)
+    recover_statements(tokens, index, None, True, diagnostics, symbols, tree)
+    return diagnostics
+
+
+# recover_program's loop from the statement at index, first when it is the
+# program's first statement, appending to diagnostics. With a stop index it
+# returns once a statement starts at or after stop, otherwise at end or when
+# the tokens run out. Returns the index it stopped at and whether the program
+# is finished.
+def recover_statements(tokens, index, stop, first, diagnostics, symbols=None, tree=None):
+    while stop is None or index < stop:
+        if at_end(tokens, index):
+            line_number, column = token_position(tokens, index - 1) if index else (1, 1)
+            diagnostics.append(Diagnostic("Make sure the program ends with 'end'", index, line_number, column))
+            if tree is not None:
+                tree.close()
+            return index, True
+        token = tokens[index]
+        line_number = token.line_number
+        if tree is not None:
+            column = token_position(tokens, index)[1]
+        try:
+            next_index = parse_next_statement(tokens, index, first)
+        except SyntaxError as e:
+            error_index = getattr(e, "index", index)
+            diagnostics.append(Diagnostic(str(e).strip(), error_index, *token_position(tokens, error_index)))
+            # A statement that fails still ends the blocks left of it
+            if tree is not None and column is not None:
+                tree.close_blocks(column)
+            index = synchronize(tokens, index, line_number, error_index)
+        except IndexError:
+            # The statement ran out of tokens, as in a program without end;
+            # a cursor has read them all by now
+            index = tokens.fetched if isinstance(tokens, TokenCursor) else len(tokens)
+            line_number, column = token_position(tokens, index - 1) if index else (1, 1)
+            diagnostics.append(Diagnostic("Make sure the program ends with 'end'", index, line_number, column))
+            if tree is not None:
+                tree.close()
+            return index, True
+        else:
+            if next_index is None:
+                if tree is not None:
+                    tree.finish(index)
+                return index, True
+            if symbols is not None:
+                declare_symbols(symbols, tokens, index, next_index)
+            if tree is not None:
+                add_statement_parts(tree, tokens, tree.add_statement(token.kind, index, next_index - 1, column),
+                                    index, next_index)
+            index = next_index
+        first = False
+    return index, False
+
+
+# Print the verdict of a recovering parse and each of its diagnostics
+def print_diagnostics(diagnostics):
+    if not diagnostics:
+        print("\n\t\t\tPARSED SUCCESSFULLY\t\t\t\n")
+    else:
+        print("\n\t\t\tSYNTAX ERROR\t\t\t\n")
+        for diagnostic in diagnostics:
+            print("Error:", diagnostic)
+
+
+# Parse and print the verdict. Returns the error like check_program, or with
+# recover, every Diagnostic from recover_program.
+def parse_program(tokens, index, engine="recursive", recover=False, symbols=None, tree=None):
+    if recover:
+        diagnostics = recover_program(tokens, index, symbols, tree)
+        print_diagnostics(diagnostics)
+        return diagnostics
+    error = check_program(tokens, index, engine, symbols, tree)
+    if error is None:
+        print("\n\t\t\tPARSED SUCCESSFULLY\t\t\t\n")
+    else:
+        print("\n\t\t\tSYNTAX ERROR\t\t\t\n")
+        if isinstance(error, IndexError):
+            print("Error: Make sure the program ends with 'end'")
+    return error
+
+# Helper function to parse a statement. Each statement parser stops at the
+# end of its own statement and returns the index of the next one.
+def parse_statement(tokens,index):
+    token = tokens[index]
+    parser = statement_parsers.get(token.kind)
+    if parser is not None:
+        return parser(tokens, index)
+    else:
+        # Handle error: Invalid statement
+        raise ParseError("\nInvalid statement\n", index)
+
+
+# Parse the statement at index, or stop at end. Every statement but the first
+# must start with one of statement_kinds. Returns the index of the next
+# statement, or None at end.
+def parse_next_statement(tokens, index, first=False):
+    token = tokens[index]
+    if not first:
+        if trace_rules: tracer.rule("In Parsing Body")
+        if trace_tokens: tracer.token(index, token)
+        if token.kind not in statement_kinds:
+            # Handle error: Invalid body
+            raise ParseError("Invalid body", index)
+    if token.kind == TokenType.END:
+        if trace_summary: tracer.summary("Parsed successfully")
+        return None
+    _, index = parse_statement(tokens, index)
+    return index
+
+
+# Parse the statements of the program one after another, up to end. Each
+# statement parser returns at the end of its own statement, so the stack
+# depth stays constant however many statements the program has. The body of
+# a while, for, if, def or class is the statements indented under it, which
+# the tree and symbol table work out from columns. Each statement's symbols
+# are declared in symbols and its node added to tree, if given. Returns the
+# number of statements.
+def parse_statements(tokens, index, symbols=None, tree=None):
+    count = 0
+    if tree is not None:
+        tree.begin(index)
+    while True:
+        kind = tokens[index].kind
+        if tree is not None:
+            # Read before the statement, while a cursor still holds its first token
+            column = token_position(tokens, index)[1]
+        next_index = parse_next_statement(tokens, index, count == 0)
+        if next_index is None:
+            if tree is not None:
+                tree.finish(index)
+            return count
+        if symbols is not None:
+            declare_symbols(symbols, tokens, index, next_index)
+        if tree is not None:
+            add_statement_parts(tree, tokens, tree.add_statement(kind, index, next_index - 1, column),
+                                index, next_index)
+        index = next_index
+        count += 1
+
+
+# Declare what the statement from start up to end defines: a class or def
+# name, which also opens its scope, def parameters, the target of an
+# assignment, for loop or object_call, and self. attributes. Scopes close at
+# the first statement that starts at or left of their def or class, the way
+# indentation reads; tokens without columns leave them open until end.
+def declare_symbols(symbols, tokens, start, end):
+    symbols.close_scopes(token_position(tokens, start)[1])
+    index = start
+    while index < end:
+        kind = tokens[index].kind
+        if kind in (TokenType.CLASS, TokenType.DEF) and index + 1 < end:
+            name = tokens[index + 1].value
+            scope_kind = "class" if kind == TokenType.CLASS else "function"
+            symbols.declare(name, scope_kind, index + 1)
+            symbols.enter_scope(name, scope_kind, token_position(tokens, index)[1])
+            index += 2
+            if kind == TokenType.DEF and index < end and tokens[index].kind == TokenType.LPAREN:
+                index += 1
+                while index < end and tokens[index].kind != TokenType.RPAREN:
+                    if tokens[index].kind in (TokenType.IDENTIFIER, TokenType.SELF):
+                        symbols.declare(tokens[index].value, "parameter", index)
+                    index += 1
+            continue
+        if (kind == TokenType.SELF and index + 3 < end and tokens[index + 1].kind == TokenType.DOT
+                and tokens[index + 3].kind == TokenType.ASSIGNMENT_OPERATOR):
+            symbols.declare_attribute(tokens[index + 2].value, index + 2)
+            index += 4
+            continue
+        if kind in (TokenType.FOR, TokenType.OBJECT_CALL) and index + 1 < end:
+            if tokens[index + 1].kind == TokenType.IDENTIFIER:
+                symbols.declare(tokens[index + 1].value, "variable", index + 1)
+            index += 2
+            continue
+        if (kind == TokenType.IDENTIFIER and index == start and index + 1 < end
+                and tokens[index + 1].kind == TokenType.ASSIGNMENT_OPERATOR):
+            symbols.declare(tokens[index].value, "variable", index)
+        index += 1
+
+
+# The token and node kinds add_statement_parts compares with, as plain ints
+(while_kind, if_kind, elif_kind, identifier_kind, self_kind, assignment_operator_kind, return_kind, lparen_kind,
+ rparen_kind, comma_kind, object_call_kind) = map(int, (TokenType.WHILE, TokenType.IF, TokenType.ELIF,
+                                                        TokenType.IDENTIFIER, TokenType.SELF,
+                                                        TokenType.ASSIGNMENT_OPERATOR, TokenType.RETURN,
+                                                        TokenType.LPAREN, TokenType.RPAREN, TokenType.COMMA,
+                                                        TokenType.OBJECT_CALL))
+condition_kind, expression_kind, arguments_kind = map(int, (NodeKind.CONDITION, NodeKind.EXPRESSION,
+                                                            NodeKind.ARGUMENTS))
+
+
+# Add the parts of the statement from start up to end, whose tree node is
+# node: the condition of a while (the tokens before its colon) or of an if
+# or elif (inside its parentheses), the expression after the = of an
+# assignment or after return, and every other parenthesized list in the
+# statement as an arguments node with an expression for each comma-separated
+# item. A list inside the expression goes under the expression, and a list
+# inside an item, as in int ( input ( "p" ) ), under the item. An object_call
+# takes any token but ) as an argument, ( included, so its list never nests.
+# The statement has parsed, so its tokens are known to have this shape.
+def add_statement_parts(tree, tokens, node, start, end):
+    # Token kinds by index, without making a Token for each
+    if isinstance(tokens, TokenBuffer):
+        kinds = tokens.kinds
+    else:
+        kinds = {index: tokens[index].kind for index in range(start, end)}
+    kind = kinds[start]
+    last = end - 1
+    if kind == while_kind:
+        tree.add_part(node, condition_kind, start + 1, last - 1)
+        return
+    if kind == if_kind or kind == elif_kind:
+        tree.add_part(node, condition_kind, start + 2, last - 2)
+        return
+    index = start
+    parent = node
+    if kind == identifier_kind or kind == self_kind:
+        while kinds[index] != assignment_operator_kind:
+            index += 1
+        index += 1
+        parent = tree.add_part(node, expression_kind, index, last)
+    elif kind == return_kind and end > start + 1:
+        index += 1
+        parent = tree.add_part(node, expression_kind, index, last)
+    # The lists still open, innermost last, each with the item of the list
+    # around it that it is in. item is the expression node of the item being
+    # read in the innermost list; an item's last token, like a list's, is
+    # only set once it ends.
+    nests = kind != object_call_kind
+    lists = []
+    item = None
+    lasts = tree.lasts
+    while index < end:
+        token_kind = kinds[index]
+        if not lists:
+            if token_kind == lparen_kind:
+                lists.append((tree.add_part(parent, arguments_kind, index, index), None))
+        elif token_kind == rparen_kind or token_kind == comma_kind:
+            if item is not None:
+                lasts[item] = index - 1
+                item = None
+            if token_kind == rparen_kind:
+                arguments, item = lists.pop()
+                lasts[arguments] = index
+        else:
+            if item is None:
+                item = tree.add_part(lists[-1][0], expression_kind, index, index)
+            if token_kind == lparen_kind and nests:
+                lists.append((tree.add_part(item, arguments_kind, index, index), item))
+                item = None
+        index += 1
+
+
+# Reparses an IncrementalLexer's tokens after each edit. The first token index
+# of every top-level statement is kept, along with where parsing stopped (the
+# end keyword, or the statement that failed) and the error. A statement's
+# parse only depends on its own tokens and the one after them, so an edit
+# reparses from the first statement that reaches the changed tokens and stops
+# as soon as a statement starts where one started before, past the change.
+# The statements after an edit move by how many tokens it added, which is
+# kept as one pending shift for every statement from shift_from on rather
+# than added to each of them. The next edit only adds it to the statements
+# between the two edits, so an edit costs about as much as the statements it
+# reparses and its distance from the last one, not the size of the file.
+class IncrementalParser:
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.starts = array('I')
+        self.kinds = array('B')
+        self.shift_from = 0
+        self.shift = 0
+        self.stop = 0
+        self.error = None
+        self.reparse(0)
+
+    # First token index of a statement
+    def start(self, statement):
+        if statement >= self.shift_from:
+            return self.starts[statement] + self.shift
+        return self.starts[statement]
+
+    # (kind, first token index, index of the next statement) of every
+    # statement parsed before stop
+    def statements(self):
+        starts = list(self.starts[:self.shift_from]) + list(shift_column(self.starts[self.shift_from:], self.shift))
+        ends = starts[1:] + [self.stop]
+        return list(zip(map(TokenType, self.kinds), starts, ends))
+
+    # Add the pending shift to the statements from first up to last
+    def apply_shift(self, first, last):
+        self.starts[first:last] = shift_column(self.starts[first:last], self.shift)
+
+    # Apply an edit to the lexer, then reparse what it touched. Returns the
+    # error, or None when the program parses.
+    def edit(self, offset, removed, inserted):
+        first_token, removed_tokens, inserted_tokens = self.lexer.edit(offset, removed, inserted)
+        if first_token > self.stop:
+            if self.error is None:
+                # Everything that changed is after end
+                return None
+            # The failed statement may have read past where it started
+            statement = len(self.starts)
+        else:
+            # First statement whose span or lookahead token reaches the change
+            starts, shift_from = self.starts, self.shift_from
+            if shift_from < len(starts) and first_token > starts[shift_from] + self.shift:
+                statement = bisect_left(starts, first_token - self.shift, max(shift_from, 1)) - 1
+            else:
+                statement = bisect_left(starts, first_token, 1, max(shift_from, 1)) - 1
+        self.reparse(statement, True, first_token + removed_tokens, inserted_tokens - removed_tokens)
+        return self.error
+
+    # Parse again from statement, the last one kept. After an edit, which
+    # replaced the old tokens before changed_end and moved the rest by delta,
+    # stop at the first statement past the change that starts where one
+    # started before.
+    def reparse(self, statement, edited=False, changed_end=0, delta=0):
+        tokens = self.lexer.tokens
+        count = len(self.starts)
+        old_stop, old_error = self.stop, self.error
+        starts = array('I')
+        kinds = array('B')
+        if not edited:
+            index = 0
+        elif statement < count:
+            index = self.start(statement)
+        else:
+            index = old_stop
+        old_statement = statement
+        while True:
+            old_index = index - delta
+            if edited and old_index >= changed_end:
+                while old_statement < count and self.start(old_statement) < old_index:
+                    old_statement += 1
+                if old_statement < count:
+                    unchanged = self.start(old_statement) == old_index
+                else:
+                    unchanged = old_index == old_stop
+                if old_statement > 0 and unchanged:
+                    # The rest of the program is unchanged, only moved by delta
+                    self.splice(statement, old_statement, starts, kinds, delta)
+                    if delta and isinstance(old_error, ParseError):
+                        old_error = ParseError(old_error.msg, old_error.index + delta)
+                    self.stop = old_stop + delta
+                    self.error = old_error
+                    return
+            try:
+                next_index = parse_next_statement(tokens, index, statement + len(starts) == 0)
+            except (SyntaxError, IndexError) as e:
+                self.stop = index
+                self.error = e
+                break
+            if next_index is None:
+                self.stop = index
+                self.error = None
+                break
+            starts.append(index)
+            kinds.append(tokens[index].kind)
+            index = next_index
+        # Parsing stopped before reaching the old statements again
+        if self.shift_from < statement:
+            self.apply_shift(self.shift_from, statement)
+        del self.starts[statement:]
+        del self.kinds[statement:]
+        self.starts.extend(starts)
+        self.kinds.extend(kinds)
+        self.shift_from = len(self.starts)
+        self.shift = 0
+
+    # Replace the old statements from first up to last with the reparsed ones,
+    # starts and kinds, and move the statements after them by delta
+    def splice(self, first, last, starts, kinds, delta):
+        shift_from = self.shift_from if self.shift else last
+        if shift_from < first:
+            # The last edit's shift is due up to this edit's statements
+            self.apply_shift(shift_from, first)
+            shift_from = last
+        elif shift_from <= last:
+            shift_from = last
+        else:
+            # Between this edit and the last, only this edit's delta applies
+            self.starts[last:shift_from] = shift_column(self.starts[last:shift_from], delta)
+        self.starts[first:last] = starts
+        self.kinds[first:last] = kinds
+        self.shift_from = shift_from + len(starts) - (last - first)
+        self.shift += delta
+
+
+# Parse a while loop
+def parse_while_loop(tokens,index):
+    if trace_rules: tracer.rule("Parsing while loop")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.WHILE:
+        if trace_rules: tracer.rule("Parsing condition")
+        index = index + 1
+        token = tokens[index]
+        token, index  = parse_condition(tokens,index)
+        
+        if trace_tokens: tracer.token(index, token)
+        
+        if token.kind == TokenType.COLON:
+                if trace_rules: tracer.rule("Parsing body")
+                if trace_tokens: tracer.token(index, token)
+                index += 1
+                token = tokens[index]
+                if trace_rules: tracer.rule("index is", index)
+                if token.kind == TokenType.NEWLINE:
+                    index += 1
+                if trace_tokens: tracer.token(index, token)
+                while tokens[index].kind == TokenType.NEWLINE:
+                    index += 1
+                    token = tokens[index]
+                return token, index
+        else:
+            # Handle error: Expected ':'
+            raise ParseError("Expected ':' after while condition", index)
+    else:
+        # Handle error: Invalid while loop
+        raise ParseError("Invalid while loop", index)
+
+
+# Parse a condition
+def parse_condition(tokens,index):
+    if trace_rules: tracer.rule("Parsing inside condition")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+        if trace_rules: tracer.rule("Parsing expression condition1")
+        index = index +1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind in (TokenType.LESS, TokenType.GT):
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.ASSIGNMENT_OPERATOR:
+                index += 1
+                token = tokens[index]
+                if trace_rules: tracer.rule("ahh")
+                if trace_tokens: tracer.token(index, token)
+                if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                    if trace_rules: tracer.rule("Parsing expression condition2")
+                    index = index +1
+                    token = tokens[index]
+                    if trace_tokens: tracer.token(index, token)
+                    return token, index
+                else:
+                    raise ParseError("Invalid condition", index)
+            else:
+                index += 1
+                token = tokens[index]
+                if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                    if trace_rules: tracer.rule("Parsing expression condition2")
+                    index = index +1
+                    token = tokens[index]
+                    if trace_tokens: tracer.token(index, token)
+                    return token, index
+                else:
+                    raise ParseError("Invalid condition", index)
+
+        elif token.kind in (TokenType.EQ, TokenType.NOTEQ):
+            index = index +1
+            token = tokens[index]
+            
+            if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                if trace_rules: tracer.rule("Parsing expression condition2")
+                index = index +1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                return token, index
+            else:
+                raise ParseError("Invalid condition", index)
+        else:
+            raise ParseError("Invalid condition", index)
+    else:
+       raise ParseError("Invalid condition", index)
+
+
+#Parse a for loop
+def parse_for_loop(tokens,index):
+    if trace_rules: tracer.rule("Parsing for loop")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.FOR:
+        index +=1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.IDENTIFIER:
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.IN:
+                index +=1
+                token =tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind == TokenType.RANGE:
+                    index +=1
+                    token = tokens[index]
+                    if trace_tokens: tracer.token(index, token)
+                    if token.kind == TokenType.LPAREN:
+                        index +=1
+                        token = tokens[index]
+                        
+                        if trace_tokens: tracer.token(index, token)
+                        if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                            index +=1
+                            token = tokens[index]
+                            if trace_tokens: tracer.token(index, token)
+                            if token.kind == TokenType.COMMA:
+                                index =index + 1
+                                token = tokens[index]
+                                if trace_tokens: tracer.token(index, token)
+                                if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                                    index +=1
+                                    token = tokens[index]
+                                    if trace_tokens: tracer.token(index, token)
+                                    if token.kind == TokenType.RPAREN:
+                                        index +=1
+                                        token = tokens[index]
+                                        if trace_tokens: tracer.token(index, token)
+                                        if token.kind == TokenType.COLON:
+                                            index +=1
+                                            token = tokens[index]
+                                            return token, index
+                                        else:
+                                            raise ParseError("Invalid for loop", index)
+                                    else:
+                                        raise ParseError("Invalid for loop", index)
+                                else:
+                                    raise ParseError("Invalid for loop", index)
+                            else:
+                                    raise ParseError("Invalid for loop", index)
+                        else:
+                            raise ParseError("Invalid for loop", index)
+                    else:
+                            raise ParseError("Invalid for loop", index)
+                else:
+                    raise ParseError("Invalid for loop", index)
+            else:
+                raise ParseError("Invalid for loop", index)
+        else:
+            raise ParseError("Invalid for loop", index)
+    else:
+        raise ParseError("Invalid for loop", index)
+                    
+
+def parse_print_statement(tokens, index):
+    if trace_rules: tracer.rule("Parsing print statement")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.PRINT:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.LPAREN:
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+
+            # Parse the first expression
+            if token.kind == TokenType.DOUBLE_QUOTE:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if trace_rules: tracer.rule("Found string:", token.value)
+                if token.kind == TokenType.STRING_LITERAL:
+                    index += 1
+                    token = tokens[index]
+                    if trace_tokens: tracer.token(index, token)
+            elif token.kind == TokenType.IDENTIFIER:
+                if trace_rules: tracer.rule("Found identifier:", token.value)
+                index += 1
+                token = tokens[index]
+            elif token.kind == TokenType.NUMERAL:
+                if trace_rules: tracer.rule("Found numeral:", token.value)
+                index += 1
+                token = tokens[index]
+            else:
+                raise ParseError("Invalid print statement", index)
+
+
+            # Parse additional expressions if any
+            while token.kind == TokenType.COMMA:
+                index += 1
+                token = tokens[index]
+                
+
+                if token.kind == TokenType.DOUBLE_QUOTE:
+                    index += 1
+                    token = tokens[index]
+                    if trace_rules: tracer.rule("Found string:", token.value)
+                    if token.kind == TokenType.STRING_LITERAL:
+                        index += 1
+                        token = tokens[index]
+                        if trace_tokens: tracer.token(index, token)
+                elif token.kind == TokenType.IDENTIFIER:
+                    if trace_rules: tracer.rule("Found identifier:", token.value)
+                    index += 1
+                    token = tokens[index]
+                elif token.kind == TokenType.NUMERAL:
+                    if trace_rules: tracer.rule("Found numeral:", token.value)
+                    index += 1
+                    token = tokens[index]
+                else:
+                    raise ParseError("Invalid print statement", index)
+
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.RPAREN:
+                index +=1
+                token = tokens[index]
+                if trace_rules: tracer.rule("Print statement parsed successfully")
+                return token, index
+            else:
+                raise ParseError("Invalid print statement", index)
+        else:
+            raise ParseError("Invalid print statement", index)
+    else:
+        raise ParseError("Invalid print statement", index)
+
+
+def parse_inc_dec_statement(tokens, index):
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind in (TokenType.INC, TokenType.DEC):
+        index +=1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.IDENTIFIER:
+            index +=1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.COLON:
+                index +=1
+                token = tokens[index]
+                if trace_rules: tracer.rule("Increment/Decrement statement parsed successfully")
+                return token, index
+            else:
+                raise ParseError("Invalid increment/decrement statement", index)
+        else:
+            raise ParseError("Invalid increment/decrement statement", index)
+
+
+def parse_input_statement(tokens, index):
+    if trace_rules: tracer.rule("Parsing input statement")
+
+    
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+
+    if token.kind == TokenType.INT :
+        
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+
+
+                if token.kind == TokenType.LPAREN:
+                        index += 1
+                        token = tokens[index]
+                        if trace_tokens: tracer.token(index, token)
+                        
+                        if token.kind == TokenType.INPUT:
+                            index += 1
+                            token = tokens[index]
+                            if token.kind == TokenType.LPAREN:
+                                index += 1
+                                token = tokens[index]
+
+                                if token.kind == TokenType.DOUBLE_QUOTE:
+                                    if trace_rules: tracer.rule("Prompt:", token.value)
+                                    index += 1
+                                    token = tokens[index]
+                                
+                                    if token.kind == TokenType.STRING_LITERAL:
+                                        if trace_rules: tracer.rule("Prompt:", token.value)
+                                        index += 1
+                                        token = tokens[index] 
+                                        
+                                        if token.kind == TokenType.RPAREN:
+                                            index +=1
+                                            token = tokens[index]
+
+                                            if token.kind == TokenType.RPAREN:
+                                                index +=1
+                                                token = tokens[index]
+                                                if trace_rules: tracer.rule("Input statement parsed successfully")
+                                                return token, index
+                raise ParseError("Invalid input statement", index)
+
+    elif token.kind == TokenType.INPUT:
+        
+                            index += 1
+                            token = tokens[index]
+                            if trace_tokens: tracer.token(index, token)
+                            if token.kind == TokenType.LPAREN:
+                                index += 1
+                                token = tokens[index]
+                                if trace_tokens: tracer.token(index, token)
+
+                                if token.kind == TokenType.DOUBLE_QUOTE:
+                                    if trace_rules: tracer.rule("Prompt:", token.value)
+                                    index += 1
+                                    token = tokens[index]
+                                    if trace_tokens: tracer.token(index, token)
+                                    
+                                    if token.kind == TokenType.STRING_LITERAL:
+                                        if trace_rules: tracer.rule("Prompt:", token.value)
+                                        index += 1
+                                        token = tokens[index] 
+
+                                        if token.kind == TokenType.RPAREN:
+                                            if trace_tokens: tracer.token(index, token)
+                                            index +=1
+                                            token = tokens[index]
+                                            if trace_rules: tracer.rule("Input statement parsed successfully")
+                                            return token, index
+                                        else:
+                                            raise ParseError("Invalid input statement", index)
+                                    else:
+                                        raise ParseError("Invalid input statement", index)
+                                else:
+                                    raise ParseError("Invalid input statement", index)
+                            else:
+                                    raise ParseError("Invalid input statement", index)
+    else:
+        raise ParseError("Invalid input statement", index)
+                    
+
+def parse_expression(tokens, index):
+    if trace_rules: tracer.rule("Parsing inside expression")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token, 2)
+    if token.kind == TokenType.ASSIGNMENT_OPERATOR:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind in (TokenType.IDENTIFIER, TokenType.INT, TokenType.FLOAT, TokenType.NUMERAL, TokenType.FLT_NUMERAL, TokenType.DOUBLE_QUOTE, TokenType.INPUT):
+            if trace_rules: tracer.rule("Parsing identifier expression")
+            if token.kind in (TokenType.INPUT, TokenType.INT, TokenType.FLOAT):
+                if trace_rules: tracer.rule("helo")
+                token, index = parse_input_statement(tokens, index)
+                return token, index
+            elif token.kind == TokenType.DOUBLE_QUOTE:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind == TokenType.STRING_LITERAL:
+                    if trace_tokens: tracer.token(index, token)
+                    index +=1
+                    if trace_rules: tracer.rule("parsed")
+                    return token, index
+                else:
+                    raise ParseError("Invalid string literal", index)
+            elif token.kind == TokenType.NUMERAL:
+                if trace_rules: tracer.rule("numeral")
+                index +=1
+                if trace_rules: tracer.rule("parsed")
+                return token, index
+            elif token.kind == TokenType.FLT_NUMERAL:
+                index +=1
+                if trace_rules: tracer.rule("parsed")
+                return token, index
+            elif token.kind == TokenType.IDENTIFIER:
+                index +=1
+                if trace_tokens: tracer.token(index, token)
+                if trace_rules: tracer.rule("parsed")
+                return token, index
+        else:
+            raise ParseError("Invalid expression", index)
+    else:
+        # Handle error: Invalid expression
+        raise ParseError("Invalid expression", index)
+    
+    
+def parse_assignment_statement(tokens, index):
+    if trace_rules: tracer.rule("Parsing assignment statement")
+
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.IDENTIFIER:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.ASSIGNMENT_OPERATOR:
+            if trace_tokens: tracer.token(index, token)
+            token, index = parse_expression(tokens, index)
+            return token, index
+        else:
+            # Handle error: Invalid assignment statement
+            raise ParseError("Expected '=' in assignment statement", index)
+    else:
+        # Handle error: Invalid assignment statement
+        raise ParseError("Invalid variable name in assignment statement", index)
+
+
+def parse_function(tokens, index):
+    if trace_rules: tracer.rule("Parsing Function")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.DEF:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.IDENTIFIER:
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.LPAREN:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind != TokenType.RPAREN:
+                    # Parse the first parameter
+                    if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                        index += 1
+                        token = tokens[index]
+                        if trace_tokens: tracer.token(index, token)
+                    else:
+                        raise ParseError("Invalid function", index)
+                    
+                    # Parse additional parameters if any
+                    while token.kind == TokenType.COMMA:
+                        if trace_rules: tracer.rule("Parsing additional parameters")
+                        index += 1
+                        token = tokens[index]
+                        if trace_tokens: tracer.token(index, token)
+                        if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                            index += 1
+                            token = tokens[index]
+                            if trace_tokens: tracer.token(index, token)
+                        else:
+                            raise ParseError("Invalid function", index)
+                    
+                if token.kind == TokenType.RPAREN:
+                    index += 1
+                    token = tokens[index]
+                    if trace_tokens: tracer.token(index, token)
+                    if token.kind == TokenType.COLON:
+                        index += 1
+                        token = tokens[index]
+                        return token, index
+                    raise ParseError("Invalid function", index)
+                else:
+                    raise ParseError("Invalid function", index)
+            else:
+                raise ParseError("Invalid function", index)
+        else:
+            raise ParseError("Invalid function", index)
+    else:
+        raise ParseError("Invalid function", index)
+
+
+def parse_return_statement(tokens, index):
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.RETURN:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind != TokenType.NEWLINE:
+            if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL, TokenType.FLT_NUMERAL) :
+                index += 1
+                token = tokens[index]
+            elif token.kind in (TokenType.ADD, TokenType.SUB, TokenType.MUL, TokenType.DIV, TokenType.MOD):
+                token, index = parse_operators_exp(tokens, index)
+                if trace_tokens: tracer.token(index, token)
+            else:
+                raise ParseError("Invalid return statement: Expected newline after expressions", index)
+        else:
+            expressions = []
+            index += 1
+        return token, index
+    return None, index
+
+
+def parse_operators(tokens, index):
+    if trace_rules: tracer.rule("Parsing Operators")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind in (TokenType.ADD, TokenType.SUB, TokenType.MUL, TokenType.DIV, TokenType.MOD):
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.COMMA:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind in (TokenType.IDENTIFIER, TokenType.NUMBER):
+                    index += 1
+                    token = tokens[index]
+                    return token, index
+
+    raise ParseError("Invalid operator", index)
+
+
+def parse_operators_exp(tokens, index):
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind in (TokenType.ADD, TokenType.SUB, TokenType.MUL, TokenType.DIV, TokenType.MOD):
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.COMMA:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind in (TokenType.IDENTIFIER, TokenType.NUMBER):
+                    index += 1
+                    token = tokens[index]
+                return token, index
+            raise ParseError("Invalid operator", index)
+        raise ParseError("Invalid operator", index)
+    raise ParseError("Invalid operator", index)
+ 
+
+def parse_function_call(tokens, index):
+    if trace_rules: tracer.rule("Parsing Function call")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.FUNCTION_CALL:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.IDENTIFIER:
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.LPAREN:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind != TokenType.RPAREN:
+                    # Parse the first parameter
+                    if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                        index += 1
+                        token = tokens[index]
+                        if trace_tokens: tracer.token(index, token)
+                    else:
+                        raise ParseError("Invalid function", index)
+                    
+                    # Parse additional parameters if any
+                    while token.kind == TokenType.COMMA:
+                        if trace_rules: tracer.rule("Parsing additional parameters")
+                        index += 1
+                        token = tokens[index]
+                        if trace_tokens: tracer.token(index, token)
+                        if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                            index += 1
+                            token = tokens[index]
+                            if trace_tokens: tracer.token(index, token)
+                        else:
+                            raise ParseError("Invalid function", index)
+                    
+                if token.kind == TokenType.RPAREN:
+                    index += 1
+                    token = tokens[index]
+                    if trace_tokens: tracer.token(index, token)
+                    if token.kind == TokenType.COLON:
+                        index += 1
+                        token = tokens[index]
+                        return token, index
+                    raise ParseError("Invalid function", index)
+                else:
+                    raise ParseError("Invalid function", index)
+            else:
+                raise ParseError("Invalid function", index)
+        else:
+            raise ParseError("Invalid function", index)
+    else:
+        raise ParseError("Invalid function", index)
+
+    
+def parse_class_statement(tokens, index):
+    if trace_rules: tracer.rule("Parsing class")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.CLASS:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.IDENTIFIER:
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+
+            if token.kind == TokenType.COLON:
+                index += 1
+                token = tokens[index]
+                if token.kind == TokenType.DEF:
+                    return class_body(tokens, index)
+                elif token.kind == TokenType.SELF:
+                    return class_body_values(tokens, index)
+                return token, index
+            else:
+                raise ParseError("Invalid class syntax", index)
+        else:
+            raise ParseError("Invalid class syntax", index)
+    else:
+        # Handle error: Invalid while loop
+        raise ParseError("Invalid class syntax", index)
+
+# Class body
+
+
+def class_body(tokens, index):
+    if trace_rules: tracer.rule("Parsing class body")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.DEF:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.INIT:
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.LPAREN:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind != TokenType.RPAREN:
+                    # Parse the first parameter
+                    if token.kind in (TokenType.IDENTIFIER, TokenType.SELF, TokenType.NUMERAL):
+                        index += 1
+                        token = tokens[index]
+                        if trace_tokens: tracer.token(index, token)
+                    else:
+                        raise ParseError("Invalid function", index)
+                    
+                    # Parse additional parameters if any
+                    while token.kind == TokenType.COMMA:
+                        if trace_rules: tracer.rule("Parsing additional parameters")
+                        index += 1
+                        token = tokens[index]
+                        if trace_tokens: tracer.token(index, token)
+                        if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL):
+                            index += 1
+                            token = tokens[index]
+                            if trace_tokens: tracer.token(index, token)
+                        else:
+                            raise ParseError("Invalid function", index)
+                    
+                if token.kind == TokenType.RPAREN:
+                    index += 1
+                    token = tokens[index]
+                    if trace_tokens: tracer.token(index, token)
+                    if token.kind == TokenType.COLON:
+                        if trace_rules: tracer.rule("match")
+                        index += 1
+                        token = tokens[index]
+                        if trace_tokens: tracer.token(index, token, 2)
+                        return token, index
+                    raise ParseError("Invalid function", index)
+                else:
+                    raise ParseError("Invalid function", index)
+            else:
+                raise ParseError("Invalid function", index)
+        else:
+            raise ParseError("Invalid function", index)
+    else:
+        raise ParseError("Invalid function", index)
+
+# Class self assignment
+
+def class_body_values(tokens, index):
+    token = tokens[index]
+    if trace_rules: tracer.rule("indie")
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.SELF:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.DOT:
+            index += 1
+            token = tokens[index]
+            if trace_tokens: tracer.token(index, token)
+            if token.kind == TokenType.IDENTIFIER:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind == TokenType.ASSIGNMENT_OPERATOR:
+                    index += 1
+                    token = tokens[index]
+                    if trace_tokens: tracer.token(index, token)
+                    if token.kind == TokenType.IDENTIFIER:
+                        index += 1
+                        token = tokens[index]
+                        return token, index
+                    else:
+                        raise ParseError("Invalid class syntax", index)
+                else:
+                    raise ParseError("Invalid class syntax", index)
+            else:
+                raise ParseError("Invalid class syntax", index)
+        else:
+            raise ParseError("Invalid class syntax", index)
+    else:
+        raise ParseError("Invalid class syntax", index)    
+    
+    
+    
+def parse_if_condition(tokens, index):
+    if trace_rules: tracer.rule("Parsing if condition")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.IF:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.LPAREN:
+            if trace_rules: tracer.rule("Parsing condition")
+            index = index + 1
+            token = tokens[index]
+            token, index = parse_condition(tokens, index)
+
+            if trace_tokens: tracer.token(index, token)
+
+            if token.kind == TokenType.RPAREN:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind == TokenType.COLON:
+                    index += 1
+                    token = tokens[index]
+                    return token, index
+                else:
+                    raise ParseError("Expected : after parenthesis", index)
+            else:
+                raise ParseError("Expected ')' before colon", index)
+        else:
+            raise ParseError("Expected '(' after if condition", index)
+    else:
+        # Handle error: Invalid while loop
+        raise ParseError("Invalid if loop", index)
+
+# Parse an elif condition
+
+
+def parse_elif_condition(tokens, index):
+    if trace_rules: tracer.rule("Parsing if condition")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.ELIF:
+        index += 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.LPAREN:
+            if trace_rules: tracer.rule("Parsing condition")
+            index = index + 1
+            token = tokens[index]
+            token, index = parse_condition(tokens, index)
+
+            if trace_tokens: tracer.token(index, token)
+
+            if token.kind == TokenType.RPAREN:
+                index += 1
+                token = tokens[index]
+                if trace_tokens: tracer.token(index, token)
+                if token.kind == TokenType.COLON:
+                    index += 1
+                    token = tokens[index]
+                    return token, index
+                else:
+                    raise ParseError("Expected : after parenthesis", index)
+            else:
+                raise ParseError("Expected ')' before colon", index)
+        else:
+            raise ParseError("Expected '(' after elif condition", index)
+    else:
+        # Handle error: Invalid while loop
+        raise ParseError("Invalid elif loop", index)
+
+# Parse an else condition
+
+
+def parse_else_condition(tokens, index):
+    if trace_rules: tracer.rule("Parsing else condition")
+    token = tokens[index]
+    if trace_tokens: tracer.token(index, token)
+    if token.kind == TokenType.ELSE:
+        if trace_rules: tracer.rule("Parsing condition")
+        index = index + 1
+        token = tokens[index]
+        if trace_tokens: tracer.token(index, token)
+        if token.kind == TokenType.COLON:
+            index += 1
+            token = tokens[index]
+            return token, index
+        else:
+            raise ParseError("Expected : after else", index)
+    else:
+        raise ParseError("Invalid else syntax", index)
+ 
+ 
+ 
+ 
+def parse_object_call(tokens, index):
+    token = tokens[index]
+    if token.kind == TokenType.OBJECT_CALL:
+        index += 1
+        token = tokens[index]
+        if token.kind == TokenType.IDENTIFIER:
+            index += 1
+            token = tokens[index]
+            if token.kind == TokenType.ASSIGNMENT_OPERATOR:
+                index += 1
+                token = tokens[index]
+                if token.kind == TokenType.IDENTIFIER:
+                    index += 1
+                    token = tokens[index]
+                    if token.kind == TokenType.LPAREN:
+                        index += 1
+                        token = tokens[index]
+                        while token.kind != TokenType.RPAREN:
+                            if token.kind in (TokenType.IDENTIFIER, TokenType.NUMERAL, TokenType.FLT_NUMERAL, TokenType.DOUBLE_QUOTE):
+                                if token.kind == TokenType.DOUBLE_QUOTE:
+                                    index += 1
+                                    token = tokens[index]
+                                    if token.kind != TokenType.STRING_LITERAL:
+                                        raise ParseError("Invalid object call: Expected string literal", index)
+                            index += 1
+                            token = tokens[index]
+                            if token.kind == TokenType.COMMA:
+                                index += 1
+                                token = tokens[index]
+                        index += 1
+                        return token, index
+                    else:
+                        raise ParseError("Invalid object call: Expected '(' after method name", index)
+                else:
+                    raise ParseError("Invalid object call: Expected method name", index)
+            else:
+                raise ParseError("Invalid object call: Expected assignment operator", index)
+        else:
+            raise ParseError("Invalid object call: Expected object name", index)
+    else:
+        raise ParseError("Invalid object call: Expected 'object_call' keyword", index)
+
+
+
+# Statement parsers by the kind of the statement's first token
+statement_parsers = {
+    TokenType.WHILE: parse_while_loop,
+    TokenType.SELF: class_body_values,
+    TokenType.FOR: parse_for_loop,
+    TokenType.PRINT: parse_print_statement,
+    TokenType.IF: parse_if_condition,
+    TokenType.ELIF: parse_elif_condition,
+    TokenType.ELSE: parse_else_condition,
+    TokenType.CLASS: parse_class_statement,
+    TokenType.FUNCTION_CALL: parse_function_call,
+    TokenType.INC: parse_inc_dec_statement,
+    TokenType.DEC: parse_inc_dec_statement,
+    TokenType.DEF: parse_function,
+    TokenType.RETURN: parse_return_statement,
+    TokenType.IDENTIFIER: parse_assignment_statement,
+    TokenType.OBJECT_CALL: parse_object_call,
+    TokenType.ADD: parse_operators,
+    TokenType.SUB: parse_operators,
+    TokenType.MUL: parse_operators,
+    TokenType.DIV: parse_operators,
+}
+
+# Kinds that can start a statement inside a body
+statement_kinds = frozenset(statement_parsers) | {TokenType.INPUT, TokenType.END}
+
+ll1_grammar_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CFGs.ll1")
+ll1_parsers = {}
+
+
+# The table-driven LL(1) parser for CFGs.ll1. The parse table is built once
+# and cached on disk next to the grammar. ll1_parser is imported here rather
+# than at the top so that importing the parser does not load hashlib and json.
+def get_ll1_parser():
+    if ll1_grammar_path not in ll1_parsers:
+        from . import ll1_parser
+        ll1_parsers[ll1_grammar_path] = ll1_parser.LL1Parser(ll1_grammar_path, TokenType)
+    return ll1_parsers[ll1_grammar_path]
+
+
+# Time the recursive parse_statement family against the LL(1) engine on the
+# same tokens. The recursive parser's own output is thrown away while timing.
+def benchmark_parsers(tokens, repeat=5):
+    tokens = list(tokens)
+
+    def run_recursive():
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_program(tokens, 0)
+
+    def run_ll1():
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_program(tokens, 0, "ll1")
+
+    get_ll1_parser()
+    results = {}
+    for name, run in [("recursive", run_recursive), ("ll1", run_ll1)]:
+        results[name] = min(timeit.repeat(run, number=1, repeat=repeat))
+        print(f"{name:<10} {results[name] * 1000:10.3f} ms  "
+              f"{len(tokens) / results[name]:12.0f} tokens/s")
+    return results
@@ -0,0 +1,115 @@
+import sys
+
+
+# A name the program declares: a class, function, parameter, variable or
+# self. attribute. scope is the dotted name of the scope it belongs to and
+# index the token index where it is declared.
+class Symbol:
+    __slots__ = ("name", "kind", "scope", "index")
+
+    def __init__(self, name, kind, scope, index):
+        self.name = name
+        self.kind = kind
+        self.scope = scope
+        self.index = index
+
+    def __str__(self):
+        return f"{self.scope}.{self.name} -> {self.kind}"
+
+
+# A def or class body. column is that of the def or class keyword, or None
+# when the tokens carry no columns; names holds what was declared in it.
+class Scope:
+    __slots__ = ("name", "kind", "column", "names")
+
+    def __init__(self, name, kind, column):
+        self.name = name
+        self.kind = kind
+        self.column = column
+        self.names = {}
+
+
+# The symbols the parser declares, in a stack of scopes. Every name also maps
+# to the stack of its visible declarations, innermost last, so a lookup is
+# one dict access however deeply scopes nest; leaving a scope pops the names
+# it declared. Only declarations are stored, never other lexemes.
+class SymbolTable:
+    def __init__(self):
+        self.scopes = [Scope("<module>", "module", None)]
+        self.bindings = {}
+        self.symbols = []
+
+    def enter_scope(self, name, kind, column=None):
+        qualified_name = name if len(self.scopes) == 1 else f"{self.scopes[-1].name}.{name}"
+        self.scopes.append(Scope(qualified_name, kind, column))
+
+    def exit_scope(self):
+        scope = self.scopes.pop()
+        for name in scope.names:
+            visible = self.bindings[name]
+            visible.pop()
+            if not visible:
+                del self.bindings[name]
+
+    # Leave every scope whose def or class starts at or left of column, which
+    # is where the next statement starts
+    def close_scopes(self, column):
+        if column is None:
+            return
+        while len(self.scopes) > 1 and self.scopes[-1].column is not None and column <= self.scopes[-1].column:
+            self.exit_scope()
+
+    # Declare name in scope, the current one by default. A name declared
+    # again in the same scope keeps its first Symbol.
+    def declare(self, name, kind, index=None, scope=None):
+        if scope is None:
+            scope = self.scopes[-1]
+        symbol = scope.names.get(name)
+        if symbol is None:
+            symbol = Symbol(name, kind, scope.name, index)
+            scope.names[name] = symbol
+            self.bindings.setdefault(name, []).append(symbol)
+            self.symbols.append(symbol)
+        return symbol
+
+    # self.name = ... declares an attribute of the innermost class, or of the
+    # current scope outside a class. It is looked up as "self.name".
+    def declare_attribute(self, name, index=None):
+        scope = next((scope for scope in reversed(self.scopes) if scope.kind == "class"), None)
+        return self.declare("self." + name, "attribute", index, scope)
+
+    # The innermost visible Symbol for name, or None
+    def lookup(self, name):
+        visible = self.bindings.get(name)
+        return visible[-1] if visible else None
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    def print_table(self):
+        for symbol in self.symbols:
+            print(symbol)
+
+
+# Identifier lexemes, interned once and numbered from 1 in order of first
+# appearance. Buffers and token streams can share one table so the same name
+# keeps the same id.
+class InternTable:
+    def __init__(self):
+        self.ids = {}
+        self.names = [None]
+
+    def intern(self, name):
+        symbol_id = self.ids.get(name)
+        if symbol_id is None:
+            symbol_id = len(self.names)
+            name = sys.intern(name)
+            self.ids[name] = symbol_id
+            self.names.append(name)
+        return symbol_id
+
+    def __len__(self):
+        return len(self.names) - 1
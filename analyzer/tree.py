@@ -0,0 +1,218 @@
+from array import array
+from bisect import bisect_right
+from enum import IntEnum
+
+from .lexer import TokenType
+
+
+class NodeKind(IntEnum):
+    PROGRAM = 0
+    WHILE = 1
+    FOR = 2
+    PRINT = 3
+    IF = 4
+    ELIF = 5
+    ELSE = 6
+    CLASS = 7
+    DEF = 8
+    FUNCTION_CALL = 9
+    RETURN = 10
+    ASSIGNMENT = 11
+    ATTRIBUTE_ASSIGNMENT = 12
+    INC_DEC = 13
+    OBJECT_CALL = 14
+    OPERATOR = 15
+    END = 16
+    # Parts of a statement, under its node
+    CONDITION = 17
+    EXPRESSION = 18
+    ARGUMENTS = 19
+
+
+# The node kind of a statement by the kind of its first token
+statement_node_kinds = {
+    TokenType.WHILE: NodeKind.WHILE,
+    TokenType.FOR: NodeKind.FOR,
+    TokenType.PRINT: NodeKind.PRINT,
+    TokenType.IF: NodeKind.IF,
+    TokenType.ELIF: NodeKind.ELIF,
+    TokenType.ELSE: NodeKind.ELSE,
+    TokenType.CLASS: NodeKind.CLASS,
+    TokenType.DEF: NodeKind.DEF,
+    TokenType.FUNCTION_CALL: NodeKind.FUNCTION_CALL,
+    TokenType.RETURN: NodeKind.RETURN,
+    TokenType.IDENTIFIER: NodeKind.ASSIGNMENT,
+    TokenType.SELF: NodeKind.ATTRIBUTE_ASSIGNMENT,
+    TokenType.INC: NodeKind.INC_DEC,
+    TokenType.DEC: NodeKind.INC_DEC,
+    TokenType.OBJECT_CALL: NodeKind.OBJECT_CALL,
+    TokenType.ADD: NodeKind.OPERATOR,
+    TokenType.SUB: NodeKind.OPERATOR,
+    TokenType.MUL: NodeKind.OPERATOR,
+    TokenType.DIV: NodeKind.OPERATOR,
+}
+
+# Statements whose body is the statements indented under them
+block_node_kinds = frozenset({NodeKind.WHILE, NodeKind.FOR, NodeKind.IF, NodeKind.ELIF, NodeKind.ELSE,
+                              NodeKind.CLASS, NodeKind.DEF})
+
+
+# The syntax tree the parser builds, one node per statement under a program
+# node, stored in preorder as four parallel arrays: the node kind, the
+# indexes of its first and last tokens and its number of children. About 13
+# bytes a node. A statement's first children are its parts: the condition of
+# a while, if or elif, the expression assigned or returned and every
+# parenthesized argument or parameter list, with an expression node for each
+# item. A block statement's other children are the statements indented
+# under it: it stays open until a statement starts at or left of its column,
+# or until end when the tokens carry no columns. Every node's tokens come
+# after its parent's first token, so firsts never decreases and the next
+# sibling of a node is found by bisecting firsts past its last token.
+class SyntaxTree:
+    def __init__(self):
+        self.kinds = array('B')
+        self.firsts = array('I')
+        self.lasts = array('I')
+        self.child_counts = array('I')
+        # Nodes that can still take children, with the column of their first
+        # token
+        self.open_nodes = []
+        # Last token of the last statement added, None before the first
+        self.last_statement = None
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def append(self, kind, first, last):
+        if self.open_nodes:
+            self.child_counts[self.open_nodes[-1][0]] += 1
+        self.kinds.append(kind)
+        self.firsts.append(first)
+        self.lasts.append(last)
+        self.child_counts.append(0)
+        return len(self.kinds) - 1
+
+    def begin(self, first):
+        self.open_nodes.append((self.append(NodeKind.PROGRAM, first, first), None))
+
+    # Close the open blocks that a statement at column ends. Each one's last
+    # token becomes that of the last statement added before it closed.
+    def close_blocks(self, column):
+        last = self.last_statement
+        while len(self.open_nodes) > 1:
+            node, block_column = self.open_nodes[-1]
+            if column is not None and block_column is not None and column > block_column:
+                break
+            self.lasts[node] = last
+            self.open_nodes.pop()
+
+    # Add the statement from token first to last, whose first token has kind
+    # token_kind and starts at column (None when unknown). Returns its node;
+    # its parts are added next, with add_part.
+    def add_statement(self, token_kind, first, last, column=None):
+        if column is not None:
+            self.close_blocks(column)
+        kind = statement_node_kinds[token_kind]
+        node = self.append(kind, first, last)
+        self.last_statement = last
+        if kind in block_node_kinds:
+            self.open_nodes.append((node, column))
+        return node
+
+    # Add a part from token first to last under parent, the statement just
+    # added or one of its parts. Returns the part's node.
+    def add_part(self, parent, kind, first, last):
+        self.child_counts[parent] += 1
+        self.kinds.append(kind)
+        self.firsts.append(first)
+        self.lasts.append(last)
+        self.child_counts.append(0)
+        return len(self.kinds) - 1
+
+    # end at token index closes every block and the program
+    def finish(self, index):
+        self.close_blocks(None)
+        self.append(NodeKind.END, index, index)
+        self.last_statement = index
+        self.close()
+
+    # Close whatever is still open, such as after a syntax error, which
+    # leaves the tree with the statements before it
+    def close(self):
+        self.close_blocks(None)
+        if self.open_nodes:
+            node = self.open_nodes.pop()[0]
+            if self.last_statement is not None:
+                self.lasts[node] = self.last_statement
+
+    # Index of the node after node and all its descendants
+    def subtree_end(self, node):
+        return bisect_right(self.firsts, self.lasts[node], node + 1)
+
+    # Indexes of the children of node, in order
+    def children(self, node):
+        child = node + 1
+        for _ in range(self.child_counts[node]):
+            yield child
+            child = self.subtree_end(child)
+
+    # Every node index in preorder with its depth
+    def walk(self):
+        remaining = []
+        for node in range(len(self.kinds)):
+            while remaining and remaining[-1] == 0:
+                remaining.pop()
+            if remaining:
+                remaining[-1] -= 1
+            yield node, len(remaining)
+            remaining.append(self.child_counts[node])
+
+    def __getitem__(self, node):
+        if node < 0:
+            node += len(self.kinds)
+        if not 0 <= node < len(self.kinds):
+            raise IndexError("node index out of range")
+        return Node(self, node)
+
+    def __iter__(self):
+        for node in range(len(self.kinds)):
+            yield Node(self, node)
+
+    def print_tree(self, tokens=None):
+        for node, depth in self.walk():
+            kind = NodeKind(self.kinds[node]).name
+            first, last = self.firsts[node], self.lasts[node]
+            where = f" line {tokens[first].line_number}" if tokens is not None else ""
+            print(f"{'    ' * depth}{kind} tokens {first}-{last}{where}")
+
+
+# A view of one node of a SyntaxTree. Nothing is copied out of the arrays.
+class Node:
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def kind(self):
+        return NodeKind(self.tree.kinds[self.index])
+
+    @property
+    def first(self):
+        return self.tree.firsts[self.index]
+
+    @property
+    def last(self):
+        return self.tree.lasts[self.index]
+
+    @property
+    def child_count(self):
+        return self.tree.child_counts[self.index]
+
+    @property
+    def children(self):
+        return [Node(self.tree, child) for child in self.tree.children(self.index)]
+
+    def __repr__(self):
+        return f"Node({self.kind.name}, {self.first}, {self.last}, {self.child_count})"
@@ -0,0 +1,67 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from analyzer.cache import TokenCache, cached_tokenize
+from analyzer.generate import generate_program
+
+# Sources the lexer complains about while lexing: characters no pattern
+# matches and an unterminated string literal
+noisy_sources = [
+    "x = 1 $ y\nend\n",
+    'print ( "open\nprint ( x )\nend\n',
+    "x = y # ? @ ^\nend\n",
+]
+
+
+def lex(source, cache, engine="loop"):
+    messages = io.StringIO()
+    with contextlib.redirect_stdout(messages):
+        tokens = cached_tokenize(source, cache, engine)
+    values = [(tokens.kinds[index], tokens.starts[index], tokens.ends[index], tokens.lines[index],
+               tokens.value(index)) for index in range(len(tokens))]
+    return values, messages.getvalue()
+
+
+class TokenCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    # A miss, a hit and no cache at all give the same tokens and print the
+    # same messages
+    def test_hit_replays_messages(self):
+        cache = TokenCache(self.directory)
+        for source in noisy_sources + [generate_program(2000, 3)[0]]:
+            for engine in ("loop", "regex"):
+                with self.subTest(source=source, engine=engine):
+                    expected = lex(source, None, engine)
+                    self.assertEqual(lex(source, cache, engine), expected)
+                    self.assertEqual(lex(source, cache, engine), expected)
+        self.assertTrue(any(lex(source, cache)[1] for source in noisy_sources))
+
+    # The running total matches the directory after every put and eviction
+    # keeps it under max_bytes
+    def test_eviction_keeps_total(self):
+        sources = [generate_program(3000, seed)[0] for seed in range(12)]
+        cache = TokenCache(self.directory, max_bytes=5 * 3000 * 4)
+        for source in sources + sources[:3] + sources:
+            lex(source, cache)
+            sizes = [entry.stat().st_size for entry in os.scandir(self.directory)]
+            self.assertEqual(cache.total, sum(sizes))
+            self.assertLessEqual(cache.total, cache.max_bytes)
+            self.assertLess(len(sizes), len(sources))
+        self.assertEqual(TokenCache(self.directory).total, cache.total)
+        # Storing the same source again replaces its entry
+        total = cache.total
+        cache.put(sources[-1], *cache.get(sources[-1]))
+        self.assertEqual(cache.total, total)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import contextlib
+import io
+import random
+import unittest
+from array import array
+
+from analyzer.generate import generate_program
+from analyzer.lexer import IncrementalLexer, shift_column, tokenize
+from analyzer.parser import IncrementalParser, ParseError, check_program
+
+# Pieces of text random edits insert: whole statements, and fragments that
+# break them, open or close a string literal or add and remove lines
+edit_pieces = ["x = y", "while a == b :", "print ( a )", "for i in range ( a , b ) :", "def f ( a ) :",
+               "class A :", "return a", "end", "\n", '"', "'", " ", "x", "(", ")", ":", "$", "5+"]
+
+
+# Type, message and token index of an error check_program returns
+def error_key(error):
+    if error is None:
+        return None
+    return type(error).__name__, str(error), getattr(error, "index", None)
+
+
+# Every field of every token, with identifiers by name since an incremental
+# lexer's intern table also holds names that were edited away
+def token_key(tokens):
+    return [(tokens.kinds[index], tokens.starts[index], tokens.ends[index], tokens.lines[index],
+             tokens.value(index)) for index in range(len(tokens))]
+
+
+def parser_key(parser):
+    return parser.statements(), parser.stop, error_key(parser.error)
+
+
+# Each edit must leave the lexer and parser exactly as a fresh lex and parse
+# of the edited text would
+class IncrementalDifferentialTest(unittest.TestCase):
+    def assert_fresh(self, parser, error):
+        source = parser.lexer.source
+        with contextlib.redirect_stdout(io.StringIO()):
+            tokens = tokenize(source)
+            fresh = IncrementalParser(IncrementalLexer(source))
+            expected = check_program(tokens, 0)
+        self.assertEqual(token_key(parser.lexer.tokens), token_key(tokens))
+        self.assertEqual(list(parser.lexer.tokens.line_starts), list(fresh.lexer.line_starts))
+        self.assertEqual(parser_key(parser), parser_key(fresh))
+        self.assertEqual(error_key(error), error_key(expected))
+
+    def edit(self, parser, offset, removed, inserted):
+        with contextlib.redirect_stdout(io.StringIO()):
+            error = parser.edit(offset, removed, inserted)
+        self.assert_fresh(parser, error)
+
+    def test_random_edits(self):
+        rng = random.Random(14)
+        for trial in range(150):
+            source, _ = generate_program(rng.randrange(0, 600), trial)
+            with contextlib.redirect_stdout(io.StringIO()):
+                parser = IncrementalParser(IncrementalLexer(source))
+            for _ in range(12):
+                source = parser.lexer.source
+                offset = rng.randint(0, len(source))
+                removed = rng.randint(0, min(12, len(source) - offset))
+                inserted = rng.choice(["", " ".join(rng.choice(edit_pieces) for _ in range(rng.randint(1, 3)))])
+                with self.subTest(trial=trial, source=source, edit=(offset, removed, inserted)):
+                    self.edit(parser, offset, removed, inserted)
+
+    def test_empty_program(self):
+        for offset, removed, inserted in [(0, 3, "x = "), (0, 0, "while "), (0, 0, "x = 1+\n"),
+                                          (3, 0, " print"), (4, 0, "x = y\n")]:
+            with self.subTest(edit=(offset, removed, inserted)):
+                parser = IncrementalParser(IncrementalLexer("end\n"))
+                self.edit(parser, offset, removed, inserted)
+
+    def test_edit_end(self):
+        source = "x = y\nwhile a == b :\n    print ( a )\nend\n"
+        end = source.index("end")
+        for offset, removed, inserted in [(end, 3, ""), (end, 3, "x = "), (end, 0, "x = y\n"),
+                                          (end + 1, 1, "x"), (end + 3, 0, " ( a )")]:
+            with self.subTest(edit=(offset, removed, inserted)):
+                parser = IncrementalParser(IncrementalLexer(source))
+                self.edit(parser, offset, removed, inserted)
+
+    def test_error_moves_with_edit(self):
+        parser = IncrementalParser(IncrementalLexer("x = y\nwhile :\nend\n"))
+        self.assertIsInstance(parser.error, ParseError)
+        self.edit(parser, 0, 0, "print ( a )\n")
+        self.edit(parser, 0, 12, "")
+
+
+class ShiftColumnTest(unittest.TestCase):
+    def test_shift(self):
+        # Values next to byte boundaries, up to where the largest delta still fits
+        column = array('I', [7, 8, 255, 256, 65535, 2 ** 24, 2 ** 32 - 2 ** 17])
+        for delta in (0, 1, 7, -7, 255, -1, 2 ** 16 + 3):
+            with self.subTest(delta=delta):
+                self.assertEqual(list(shift_column(column, delta)), [value + delta for value in column])
+        self.assertEqual(len(shift_column(array('I'), 5)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
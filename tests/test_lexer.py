@@ -0,0 +1,89 @@
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from analyzer.generate import generate_program
+from analyzer.lexer import lexer_engines, tokenize, tokenize_mmap
+
+# Text the generated programs never contain: characters no pattern matches,
+# unterminated and escaped string literals, keywords run into identifiers,
+# numerals and operators without spaces and blank or indented lines
+tricky_sources = [
+    "",
+    "\n\n\n",
+    "x = 1 $ y\n",
+    'print ( "open\nprint ( x )\nend\n',
+    "print ( 'single' , \"dou'ble\" )\nend\n",
+    'x = "a\\" b"\n',
+    "whilex = endx\nwhile x == y :\n    returnv\nend",
+    "x=y+z*2.5-3+\n++x:\n--y:\n",
+    "   \t  x = y\n\t\tprint ( x )   \n\n  end  \n",
+    "class C :\n    def __init__ ( self , v ) :\n        self . v = v\nend\n",
+    "x = y # comment ? @ ^\n",
+    "é = 1\nprint ( \"naïve\" )\n",
+]
+
+
+# The tokens a scanner yields for source, with what it printed
+def scan(source, engine):
+    messages = io.StringIO()
+    with contextlib.redirect_stdout(messages):
+        lexemes = list(lexer_engines[engine](source))
+    return lexemes, messages.getvalue()
+
+
+def random_sources(count, seed):
+    rng = random.Random(seed)
+    for number in range(count):
+        source, _ = generate_program(rng.randrange(0, 4000), number)
+        lines = source.split("\n")
+        for _ in range(rng.randrange(0, 6)):
+            line = rng.randrange(len(lines))
+            lines[line] += rng.choice([' "open', " 'x", " $", " ?", ' "a\\" b"', "x", "1.5", "=="])
+        yield "\n".join(lines)
+
+
+# The master regex engine must give exactly the tokens, line numbers and
+# messages of the pattern loop
+class RegexEngineTest(unittest.TestCase):
+    def assert_same(self, source):
+        self.assertEqual(scan(source, "regex"), scan(source, "loop"))
+
+    def test_tricky_sources(self):
+        for source in tricky_sources:
+            with self.subTest(source=source):
+                self.assert_same(source)
+
+    def test_generated_programs(self):
+        for source in random_sources(60, 1):
+            with self.subTest(source=source[:200]):
+                self.assert_same(source)
+
+
+# The offset scanner over a memory map or from a later line, against the
+# same text scanned as a str
+class OffsetScanTest(unittest.TestCase):
+    def test_mmap_matches_str(self):
+        sources = [source for source in tricky_sources if source.isascii()] + list(random_sources(10, 2))
+        for source in sources:
+            with self.subTest(source=source[:200]):
+                with tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False) as f:
+                    f.write(source.encode("ascii"))
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        expected = tokenize(source, "regex")
+                        tokens = tokenize_mmap(f.name)
+                    for column in ("kinds", "starts", "ends", "lines"):
+                        self.assertEqual(list(getattr(tokens, column)), list(getattr(expected, column)))
+                    self.assertEqual([token.value for token in tokens], [token.value for token in expected])
+                    if not isinstance(tokens.source, bytes):
+                        tokens.source.close()
+                finally:
+                    os.remove(f.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import contextlib
+import io
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from analyzer.generate import generate_program
+from analyzer.lexer import tokenize
+from analyzer.ll1_parser import build_parse_table, load_grammar, load_parse_table
+from analyzer.parser import check_program, ll1_grammar_path
+
+# Programs and whether the recursive parser accepts them, quirks included:
+# after < or > the next token is skipped, a quote alone is a print argument,
+# the second operand of a returned operation is optional, a def right after
+# a class header must be its __init__ and an object call takes any token but
+# ) as an argument
+hand_written = [
+    ("while a < b : end", False),
+    ("while a < x b : end", True),
+    ("while a <= b : end", True),
+    ("while a < ) b : end", True),
+    ('if ( a > " b ) : end', False),
+    ("if ( a == b ) : else : end", True),
+    ('print ( " ) end', False),
+    ('print ( "s" , x , 1+ ) end', True),
+    ("print ( 2.5 ) end", False),
+    ("return add x , end", True),
+    ("return add x , y end", True),
+    ("return mod x , y end", True),
+    ("return 2.5 end", True),
+    ("return end", False),
+    ("add x , y end", True),
+    ("mod x , y end", False),
+    ("add x , end", False),
+    ("def f ( self ) : end", False),
+    ("def __init__ ( x ) : end", False),
+    ("def f ( x , ) : end", False),
+    ("function_call f ( self ) : end", False),
+    ("class C : def __init__ ( self , v ) : self . v = v end", True),
+    ("class C : def f ( ) : end", False),
+    ("class C : def __init__ ( ) : end", True),
+    ("class C : def __init__ ( x , self ) : end", False),
+    ("class C : self . v = w end", True),
+    ("object_call o = C ( ) end", True),
+    ("object_call o = C ( x : ) end", True),
+    ("object_call o = C ( x , , y ) end", True),
+    ('object_call o = C ( " ) end', False),
+    ("object_call o = C ( = end ) end", True),
+    ('x = int ( input ( "p" ) ) end', True),
+    ("x = float ( y ) end", False),
+    ("x = y", False),
+    ("end", True),
+    ("", False),
+]
+
+# Lexemes the generated programs are mutated with
+mutations = ["x", "1+", "2.5", '"', '"s"', "(", ")", ",", ":", "=", "==", "!=", "<", ">", "<=",
+             "while", "if", "elif", "else", "for", "print", "def", "__init__", "self", ".", "class",
+             "return", "add", "mod", "object_call", "function_call", "input", "int", "++", "end", "$"]
+
+
+def verdicts(source):
+    with contextlib.redirect_stdout(io.StringIO()):
+        tokens = tokenize(source, "regex")
+        return check_program(tokens) is None, check_program(tokens, 0, "ll1") is None
+
+
+# The LL(1) grammar must accept exactly the programs the recursive parser does
+class DifferentialTest(unittest.TestCase):
+    def test_hand_written(self):
+        for source, accepted in hand_written:
+            with self.subTest(source=source):
+                self.assertEqual(verdicts(source), (accepted, accepted))
+
+    def test_generated_programs(self):
+        rng = random.Random(7)
+        accepted = 0
+        for number in range(1500):
+            source, _ = generate_program(rng.randrange(0, 400), number)
+            words = source.split(" ")
+            for _ in range(rng.randrange(0, 4)):
+                position = rng.randrange(len(words))
+                change = rng.randrange(3)
+                if change == 0:
+                    words[position] = rng.choice(mutations)
+                elif change == 1:
+                    words.insert(position, rng.choice(mutations))
+                elif len(words) > 1:
+                    del words[position]
+            source = " ".join(words)
+            recursive, ll1 = verdicts(source)
+            with self.subTest(source=source):
+                self.assertEqual(ll1, recursive)
+            accepted += recursive
+        # Both verdicts must be well represented for the comparison to mean anything
+        self.assertGreater(accepted, 300)
+        self.assertLess(accepted, 1200)
+
+
+class ParseTableTest(unittest.TestCase):
+    def test_optional_part_is_greedy(self):
+        start, productions = load_grammar("<s> -> <a> X | <a> | E\n<a> -> X <a> | E\n")
+        with self.assertRaises(ValueError):
+            build_parse_table(productions, start)
+        start, productions = load_grammar("<s> -> <a> X\n<a> -> X | E\n")
+        self.assertEqual(build_parse_table(productions, start)["<a>"]["X"], ("X",))
+
+    def test_cache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            cache_path = os.path.join(directory, "table.json")
+            built = load_parse_table(ll1_grammar_path, cache_path)
+            self.assertEqual(os.listdir(directory), ["table.json"])
+            self.assertEqual(load_parse_table(ll1_grammar_path, cache_path), built)
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
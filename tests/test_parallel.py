@@ -0,0 +1,141 @@
+import contextlib
+import io
+import random
+import unittest
+
+from analyzer.generate import generate_program
+from analyzer.lexer import tokenize
+from analyzer.parallel import chunk_starts, lex_chunk, parse_parallel, segment_starts, tokenize_parallel
+from analyzer.parser import recover_program
+from analyzer.tree import SyntaxTree
+
+token_columns = ("kinds", "starts", "ends", "lines", "symbol_ids")
+tree_columns = ("kinds", "firsts", "lasts", "child_counts")
+
+
+def run(function, *args):
+    messages = io.StringIO()
+    with contextlib.redirect_stdout(messages):
+        result = function(*args)
+    return result, messages.getvalue()
+
+
+def buffer_key(tokens):
+    return [list(getattr(tokens, column)) for column in token_columns] + [tokens.symbols.names]
+
+
+def parse_key(diagnostics, tree):
+    return ([(diagnostic.message, diagnostic.index, diagnostic.line_number, diagnostic.column)
+             for diagnostic in diagnostics], [list(getattr(tree, column)) for column in tree_columns])
+
+
+# Generated programs with string literals that stay open to the next line,
+# escaped quotes that mislead chunk_starts' quick pass over quotes, and
+# characters no pattern matches
+def mutated_programs(count, size, seed):
+    rng = random.Random(seed)
+    for number in range(count):
+        source, _ = generate_program(size, number)
+        lines = source.split("\n")
+        for _ in range(rng.randrange(0, 8)):
+            line = rng.randrange(len(lines))
+            lines[line] += rng.choice([' "open', " 'x", " $", ' "don\'t"', ' "a\\" b"', " '"])
+        yield "\n".join(lines)
+
+
+# tokenize_parallel must give the tokens, identifier ids and messages of one
+# serial tokenize, however the chunk boundaries fall
+class ParallelLexTest(unittest.TestCase):
+    def test_matches_serial(self):
+        for number, source in enumerate(mutated_programs(6, 20000, 24)):
+            self.assertGreater(len(chunk_starts(source, 2000)), 1)
+            for engine in ("loop", "regex"):
+                with self.subTest(number=number, engine=engine):
+                    serial, serial_messages = run(tokenize, source, engine)
+                    parallel, parallel_messages = run(tokenize_parallel, source, engine, 2, 2000)
+                    self.assertEqual(buffer_key(parallel), buffer_key(serial))
+                    self.assertEqual(parallel_messages, serial_messages)
+
+    # The lexer ignores the quote at the end of line 41 but chunk_starts pairs
+    # it with the one on line 82, which opens a literal for the lexer. The
+    # chunk cut after line 82 ends inside a string and has to be lexed again
+    # with the next one.
+    def test_string_across_chunks(self):
+        line = "x = y\n" * 40
+        source = line + "x = y $ '\n" + line + "print ( 'open\n" + line + "end\n"
+        starts = chunk_starts(source, len(line) - 3)
+        ends = starts[1:] + [len(source)]
+        for engine in ("loop", "regex"):
+            with self.subTest(engine=engine):
+                chunks = [run(lex_chunk, source[start:end], start, 1, engine)[0] for start, end in zip(starts, ends)]
+                self.assertTrue(any(chunk[-1] for chunk in chunks[:-1]))
+                serial, serial_messages = run(tokenize, source, engine)
+                parallel, parallel_messages = run(tokenize_parallel, source, engine, 2, len(line) - 3)
+                self.assertEqual(buffer_key(parallel), buffer_key(serial))
+                self.assertEqual(parallel_messages, serial_messages)
+
+    # A chunk is lexed with the offset and line number it has in the input
+    def test_chunk_position(self):
+        chunk = 'x = y\nprint ( "a" )\n'
+        for engine in ("loop", "regex"):
+            with self.subTest(engine=engine):
+                kinds, starts, ends, lines, _, _, _, inside_quotes = lex_chunk(chunk, 100, 41, engine)
+                serial = tokenize(chunk, engine)
+                self.assertEqual(list(kinds), list(serial.kinds))
+                self.assertEqual(list(starts), [start + 100 for start in serial.starts])
+                self.assertEqual(list(ends), [end + 100 for end in serial.ends])
+                self.assertEqual(list(lines), [line + 40 for line in serial.lines])
+                self.assertFalse(inside_quotes)
+                self.assertTrue(lex_chunk('print ( "open\n', 0, 1, engine)[-1])
+
+
+# parse_parallel must give the diagnostics and tree of one serial
+# recover_program, also when statements or recoveries run over the segment
+# boundaries and the segments have to be parsed again together
+class ParallelParseTest(unittest.TestCase):
+    def test_matches_serial(self):
+        rng = random.Random(25)
+        for number in range(8):
+            source, _ = generate_program(12000, number)
+            lines = source.split("\n")
+            for _ in range(rng.randrange(0, 10)):
+                line = rng.randrange(len(lines) - 2)
+                lines[line] = rng.choice([lines[line] + " )", "x = ", "while :", lines[line].replace(":", ""),
+                                          "    " + lines[line], lines[line] + " (" + lines[line + 1], "def"])
+            if number % 4 == 3:
+                # Without end
+                lines = lines[:-3]
+            source = "\n".join(lines)
+            if number % 3 == 1:
+                # Not ASCII, so the shared source is four bytes a character
+                source += "é = 1\n"
+            tokens, _ = run(tokenize, source, "loop" if number % 2 else "regex")
+            tree = SyntaxTree()
+            expected = parse_key(run(recover_program, tokens, 0, None, tree)[0], tree)
+            for segment_size in (50, 300):
+                self.assertGreater(len(segment_starts(tokens, segment_size)), 2)
+                with self.subTest(number=number, segment_size=segment_size):
+                    self.assertEqual(parse_key(*run(parse_parallel, tokens, 2, segment_size)[0]), expected)
+
+    # Statements that carry on over the start of the next line, where a
+    # segment can start: an assignment whose value is on the next line and
+    # an object_call whose arguments are
+    def test_statements_over_boundaries(self):
+        source = "x =\ny\n" * 40 + "object_call o = C (\nprint\nwhile )\n" * 20 + "while :\nend\n"
+        tokens, _ = run(tokenize, source)
+        tree = SyntaxTree()
+        expected = parse_key(run(recover_program, tokens, 0, None, tree)[0], tree)
+        for segment_size in (4, 5, 9):
+            with self.subTest(segment_size=segment_size):
+                self.assertEqual(parse_key(*run(parse_parallel, tokens, 2, segment_size)[0]), expected)
+
+    def test_serial_fallback(self):
+        tokens, _ = run(tokenize, generate_program(3000, 1)[0])
+        tree = SyntaxTree()
+        expected = parse_key(run(recover_program, tokens, 0, None, tree)[0], tree)
+        self.assertEqual(parse_key(*parse_parallel(tokens, 1, 50)), expected)
+        self.assertEqual(parse_parallel(tokens, 2, 50, tree=False), ([], None))
+
+
+if __name__ == "__main__":
+    unittest.main()
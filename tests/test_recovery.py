@@ -0,0 +1,75 @@
+import contextlib
+import io
+import random
+import unittest
+
+from analyzer.generate import generate_program
+from analyzer.lexer import iter_tokens, tokenize
+from analyzer.parser import recover_program, synchronize
+
+# Statements that fail on their own line
+bad_statements = ["while :", "for x :", "return )", "print ( 2.5 )", "if ( a ) :", "++ 5+ :"]
+
+
+def recover(source, stream=False):
+    with contextlib.redirect_stdout(io.StringIO()):
+        tokens = iter_tokens(source, "regex") if stream else tokenize(source, "regex")
+        diagnostics = recover_program(tokens)
+    return [(diagnostic.message, diagnostic.index, diagnostic.line_number, diagnostic.column)
+            for diagnostic in diagnostics]
+
+
+class RecoveryTest(unittest.TestCase):
+    def test_one_diagnostic_per_bad_statement(self):
+        source = "x = y\nwhile :\nprint ( a )\nfor x :\nx = 5+\nreturn )\nend\n"
+        self.assertEqual(recover(source), [
+            ("Invalid condition", 4, 2, 7),
+            ("Invalid for loop", 11, 4, 7),
+            ("Invalid return statement: Expected newline after expressions", 16, 6, 8),
+        ])
+        # A stream has no columns but finds the same errors
+        self.assertEqual(recover(source, True),
+                         [(message, index, line, None) for message, index, line, _ in recover(source)])
+
+    def test_generated_programs(self):
+        rng = random.Random(18)
+        for number in range(60):
+            source, _ = generate_program(rng.randrange(200, 3000), number)
+            lines = source.split("\n")
+            bad_lines = []
+            for _ in range(rng.randrange(1, 6)):
+                # Not between a class header and its __init__, which only
+                # parses right after the header
+                line = rng.randrange(len(lines) - 2)
+                if lines[line].lstrip().startswith("def __init__"):
+                    continue
+                lines.insert(line, rng.choice(bad_statements))
+                bad_lines = [bad + (bad >= line) for bad in bad_lines] + [line]
+            with self.subTest(source="\n".join(lines)):
+                diagnostics = recover("\n".join(lines))
+                self.assertEqual([line_number for _, _, line_number, _ in diagnostics],
+                                 sorted(line + 1 for line in bad_lines))
+
+    # The parser starts again at the token the error was found at when it can
+    # start a statement, so the statement after the error is not lost
+    def test_resume_at_error(self):
+        source = "x = while a == b :\n    print ( a )\nend\n"
+        self.assertEqual(recover(source), [("Invalid expression", 2, 1, 5)])
+        # An error found at end resumes at it, so end still finishes the program
+        self.assertEqual(recover("while a == b :\n  x = \nend\n"), [("Invalid expression", 7, 3, 1)])
+        tokens = tokenize(source, "regex")
+        self.assertEqual(synchronize(tokens, 0, 1, 2), 2)
+        self.assertEqual(synchronize(tokens, 0, 1), 2)
+        # An error at or before the statement's start skips to the next line
+        self.assertEqual(synchronize(tokenize("x = y z\nprint ( a )\nend\n", "regex"), 0, 1, 0), 4)
+
+    def test_missing_end(self):
+        # At the end of the input, on the last token
+        self.assertEqual(recover("x = y\nprint ( a )\n"), [("Make sure the program ends with 'end'", 7, 2, 11)])
+        self.assertEqual(recover("x = y\nprint ( a"), [("Make sure the program ends with 'end'", 6, 2, 9)])
+        self.assertEqual(recover(""), [("Make sure the program ends with 'end'", 0, 1, 1)])
+        self.assertEqual(recover("x = y\nprint ( a", True), [("Make sure the program ends with 'end'", 6, 2, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import contextlib
+import io
+import unittest
+
+from analyzer.lexer import iter_tokens, tokenize
+from analyzer.parser import check_program
+from analyzer.symbols import SymbolTable
+
+# Scopes nest by the column of their def or class and close at the first
+# statement at or left of it, so z goes back to C and q to the module
+nested_source = """class C :
+    def __init__ ( self , v ) :
+        self . v = v
+        w = v
+    def f ( a ) :
+        for i in range ( a , b ) :
+            x = i
+        y = a
+    z = 1+
+def g ( ) :
+    class D :
+        self . d = e
+    def h ( k ) :
+        u = k
+    t = 2.5
+q = 1+
+end
+"""
+
+
+def declared(tokens):
+    symbols = SymbolTable()
+    with contextlib.redirect_stdout(io.StringIO()):
+        error = check_program(tokens, 0, symbols=symbols)
+    return error, [(symbol.name, symbol.kind, symbol.scope) for symbol in symbols]
+
+
+class ScopeTest(unittest.TestCase):
+    def test_scopes_close_by_column(self):
+        self.assertEqual(declared(tokenize(nested_source, "regex")), (None, [
+            ("C", "class", "<module>"),
+            ("__init__", "function", "C"),
+            ("self", "parameter", "C.__init__"),
+            ("v", "parameter", "C.__init__"),
+            ("self.v", "attribute", "C"),
+            ("w", "variable", "C.__init__"),
+            ("f", "function", "C"),
+            ("a", "parameter", "C.f"),
+            ("i", "variable", "C.f"),
+            ("x", "variable", "C.f"),
+            ("y", "variable", "C.f"),
+            ("z", "variable", "C"),
+            ("g", "function", "<module>"),
+            ("D", "class", "g"),
+            ("self.d", "attribute", "g.D"),
+            ("h", "function", "g"),
+            ("k", "parameter", "g.h"),
+            ("u", "variable", "g.h"),
+            ("t", "variable", "g"),
+            ("q", "variable", "<module>"),
+        ]))
+
+    # A token stream has no columns, so every scope stays open until end
+    def test_stream_keeps_scopes_open(self):
+        error, symbols = declared(iter_tokens(nested_source, "regex"))
+        self.assertIsNone(error)
+        self.assertEqual([scope for _, _, scope in symbols[-3:]], ["C.__init__.f.g.D.h"] * 3)
+
+    def test_close_scopes(self):
+        symbols = SymbolTable()
+        symbols.enter_scope("C", "class", 1)
+        symbols.enter_scope("f", "function", 5)
+        symbols.declare("x", "variable")
+        symbols.enter_scope("g", "function", None)
+        symbols.declare("y", "variable")
+        # A scope without a column is never closed by one
+        symbols.close_scopes(1)
+        self.assertEqual(symbols.lookup("y").scope, "C.f.g")
+        symbols.exit_scope()
+        symbols.close_scopes(9)
+        self.assertEqual(symbols.lookup("x").scope, "C.f")
+        symbols.close_scopes(None)
+        self.assertEqual(symbols.lookup("x").scope, "C.f")
+        # Closing at the def's own column leaves the class open
+        symbols.close_scopes(5)
+        self.assertIsNone(symbols.lookup("x"))
+        self.assertEqual([scope.name for scope in symbols.scopes], ["<module>", "C"])
+        symbols.close_scopes(1)
+        self.assertEqual([scope.name for scope in symbols.scopes], ["<module>"])
+
+
+if __name__ == "__main__":
+    unittest.main()
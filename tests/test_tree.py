@@ -0,0 +1,89 @@
+import contextlib
+import io
+import random
+import unittest
+
+from analyzer.generate import generate_program
+from analyzer.lexer import tokenize
+from analyzer.parser import check_program, recover_program
+from analyzer.tree import NodeKind, SyntaxTree
+
+
+# (depth, kind name, first token, last token) of every node in preorder
+def shape(source):
+    tree = SyntaxTree()
+    with contextlib.redirect_stdout(io.StringIO()):
+        error = check_program(tokenize(source, "regex"), 0, tree=tree)
+    return error, [(depth, NodeKind(tree.kinds[node]).name, tree.firsts[node], tree.lasts[node])
+                   for node, depth in tree.walk()]
+
+
+class SyntaxTreeTest(unittest.TestCase):
+    # An argument list inside an item goes under the item's expression
+    def test_nested_calls(self):
+        self.assertEqual(shape('x = int ( input ( "p" ) )\nend\n'), (None, [
+            (0, "PROGRAM", 0, 10),
+            (1, "ASSIGNMENT", 0, 9),
+            (2, "EXPRESSION", 2, 9),
+            (3, "ARGUMENTS", 3, 9),
+            (4, "EXPRESSION", 4, 8),
+            (5, "ARGUMENTS", 5, 8),
+            (6, "EXPRESSION", 6, 7),
+            (1, "END", 10, 10),
+        ]))
+        # In an object_call ( is just an argument and the first ) ends the list
+        self.assertEqual(shape("object_call o = C ( ( , x )\nend\n"), (None, [
+            (0, "PROGRAM", 0, 9),
+            (1, "OBJECT_CALL", 0, 8),
+            (2, "ARGUMENTS", 4, 8),
+            (3, "EXPRESSION", 5, 5),
+            (3, "EXPRESSION", 7, 7),
+            (1, "END", 9, 9),
+        ]))
+
+    def test_blocks_by_column(self):
+        source = ("while a == b :\n    if ( a != b ) :\n        x = y\n    elif ( a == b ) :\n"
+                  "        print ( a )\nreturn a\nend\n")
+        self.assertEqual(shape(source), (None, [
+            (0, "PROGRAM", 0, 28),
+            (1, "WHILE", 0, 25),
+            (2, "CONDITION", 1, 3),
+            (2, "IF", 5, 14),
+            (3, "CONDITION", 7, 9),
+            (3, "ASSIGNMENT", 12, 14),
+            (4, "EXPRESSION", 14, 14),
+            (2, "ELIF", 15, 25),
+            (3, "CONDITION", 17, 19),
+            (3, "PRINT", 22, 25),
+            (4, "ARGUMENTS", 23, 25),
+            (5, "EXPRESSION", 24, 24),
+            (1, "RETURN", 26, 27),
+            (2, "EXPRESSION", 27, 27),
+            (1, "END", 28, 28),
+        ]))
+
+    # Nodes are in preorder, each inside its parent's tokens, with the child
+    # count it was given, also when statements fail and are skipped
+    def test_generated_programs(self):
+        rng = random.Random(21)
+        for number in range(40):
+            source, _ = generate_program(rng.randrange(200, 4000), number)
+            lines = source.split("\n")
+            for _ in range(rng.randrange(0, 4)):
+                line = rng.randrange(len(lines) - 1)
+                lines[line] = rng.choice(["x = ", "while :", lines[line] + " )"])
+            tree = SyntaxTree()
+            with contextlib.redirect_stdout(io.StringIO()):
+                recover_program(tokenize("\n".join(lines), "regex"), 0, None, tree)
+            with self.subTest(number=number):
+                self.assertEqual(list(tree.firsts), sorted(tree.firsts))
+                for node in range(len(tree)):
+                    children = list(tree.children(node))
+                    self.assertEqual(len(children), tree.child_counts[node])
+                    for child in children:
+                        self.assertLessEqual(tree.firsts[node], tree.firsts[child])
+                        self.assertLessEqual(tree.lasts[child], tree.lasts[node])
+
+
+if __name__ == "__main__":
+    unittest.main()